@@ -2,9 +2,24 @@
 Linktor Client - Main SDK entry point
 """
 
-from typing import Any, AsyncIterator, Callable, Optional
+from __future__ import annotations
 
-from linktor.utils.http import HttpClient, AsyncHttpClient
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from linktor.utils.http import (
+    DEFAULT_LIMITS,
+    AsyncHttpClient,
+    FileInput,
+    HttpClient,
+    pool_limits,
+)
+from linktor.utils.pagination import aiter_items, iter_items
+from linktor.utils.qr import render_qr
 from linktor.types import (
     PaginatedResponse,
     Conversation,
@@ -27,37 +42,194 @@ from linktor.types import (
     VRETemplateType,
     VREChannelType,
     VREOutputFormat,
+    CreateContactInput,
+    UpdateContactInput,
+    CreateChannelInput,
+    UpdateChannelInput,
+    CreateBotInput,
+    UpdateBotInput,
+    CreateAgentInput,
+    UpdateAgentInput,
+    InvokeAgentInput,
+    CreateKnowledgeBaseInput,
+    UpdateKnowledgeBaseInput,
+    QueryKnowledgeBaseInput,
+    CreateFlowInput,
+    UpdateFlowInput,
+    ExecuteFlowInput,
+    SendMessageInput,
+    UpdateConversationInput,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+ResultT = TypeVar("ResultT")
+
+# Upper bound on how long realtime metrics may be served from the cache. Only the
+# sync client caches GETs (cache_ttl); the async client always fetches them fresh.
+REALTIME_MAX_AGE = 1.0
+
+# Default number of requests bulk_get and complete_many keep in flight
+BULK_GET_CONCURRENCY = 10
+
+# Parametrized once here; subscripting PaginatedResponse costs a cache lookup per call
+_ConversationPage = PaginatedResponse[Conversation]
+_MessagePage = PaginatedResponse[Message]
+_DocumentPage = PaginatedResponse[Document]
+
+
+def _compact(**fields: Any) -> dict[str, Any]:
+    """Build a request payload, leaving out fields that are None"""
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+@lru_cache(maxsize=None)
+def _input_keys(model: type[BaseModel]) -> frozenset[str]:
+    return frozenset(
+        key
+        for name, field in model.model_fields.items()
+        for key in (name, field.alias)
+        if key
+    )
+
+
+def _dump_input(
+    model: type[BaseModel],
+    fields: dict[str, Any],
+    payload: Optional[BaseModel] = None,
+) -> dict[str, Any]:
+    """
+    Serialize write input through its input model
+
+    Known fields are validated and sent under their camelCase alias; only the
+    fields the caller set are sent, so an explicit None still clears a field.
+    Keys the model does not know are passed through as-is so newer API fields
+    keep working.
+    """
+    if payload is not None:
+        if fields:
+            raise TypeError("Pass either an input model or keyword fields, not both")
+        return payload.model_dump(mode="json", by_alias=True, exclude_unset=True)
+
+    data = model.model_validate(fields).model_dump(
+        mode="json", by_alias=True, exclude_unset=True
+    )
+    known = _input_keys(model)
+    for key, value in fields.items():
+        if key not in known:
+            data[key] = value
+    return data
+
+
+def _bulk_get(get: Callable[[str], ModelT], ids: list[str], concurrency: int) -> list[ModelT]:
+    """Run ``get`` for every id on a thread pool, keeping the input order"""
+    if len(ids) <= 1 or concurrency <= 1:
+        return [get(id) for id in ids]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(ids))) as executor:
+        return list(executor.map(get, ids))
+
+
+async def _abulk_get(
+    get: Callable[[str], Awaitable[ResultT]], ids: list[str], concurrency: int
+) -> list[ResultT]:
+    """Await ``get`` for every id with at most ``concurrency`` in flight, keeping the order"""
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def bounded(id: str) -> ResultT:
+        async with semaphore:
+            return await get(id)
+
+    return list(await asyncio.gather(*(bounded(id) for id in ids)))
+
+
+class _CRUDResource(Generic[ModelT]):
+    """Shared list/get/create/update/delete for resources under ``_path``"""
+
+    _path: str
+    _model: type[ModelT]
+    _page_model: type[PaginatedResponse[ModelT]]
+    _create_input: type[BaseModel]
+    _update_input: type[BaseModel]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._page_model = PaginatedResponse[cls._model]
+
+    def __init__(self, http: HttpClient):
+        self._http = http
+
+    def list(self, **params: Any) -> PaginatedResponse[ModelT]:
+        """List resources"""
+        raw = self._http.get_raw(self._path, params=params)
+        return self._page_model.model_validate_json(raw)
+
+    def iter_all(self, **params: Any) -> Iterator[ModelT]:
+        """Iterate over all resources, prefetching the next page"""
+        return iter_items(self.list, params)
+
+    def get(self, id: str) -> ModelT:
+        """Get resource"""
+        raw = self._http.get_raw(f"{self._path}/{id}")
+        return self._model.model_validate_json(raw)
+
+    def bulk_get(self, ids: list[str], concurrency: int = BULK_GET_CONCURRENCY) -> list[ModelT]:
+        """Get several resources concurrently over the connection pool"""
+        return _bulk_get(self.get, ids, concurrency)
+
+    def create(self, payload: Optional[BaseModel] = None, **kwargs: Any) -> ModelT:
+        """Create resource from an input model or keyword fields"""
+        body = _dump_input(self._create_input, kwargs, payload)
+        raw = self._http.post_raw(self._path, body)
+        return self._model.model_validate_json(raw)
+
+    def update(self, id: str, payload: Optional[BaseModel] = None, **kwargs: Any) -> ModelT:
+        """Update resource from an input model or keyword fields"""
+        body = _dump_input(self._update_input, kwargs, payload)
+        raw = self._http.patch_raw(f"{self._path}/{id}", body)
+        return self._model.model_validate_json(raw)
+
+    def delete(self, id: str) -> None:
+        """Delete resource"""
+        self._http.delete(f"{self._path}/{id}")
+
 
 class AuthResource:
     """Auth resource"""
 
     def __init__(self, http: HttpClient):
         self._http = http
+        self._current_user: Optional[tuple[tuple[Optional[str], Optional[str]], User]] = None
 
     def login(self, email: str, password: str) -> LoginResponse:
         """Login with email and password"""
-        data = self._http.post("/auth/login", {"email": email, "password": password})
-        response = LoginResponse(**data)
+        raw = self._http.post_raw("/auth/login", {"email": email, "password": password})
+        response = LoginResponse.model_validate_json(raw)
         self._http.set_access_token(response.access_token)
         return response
 
     def logout(self) -> None:
         """Logout"""
         self._http.post("/auth/logout")
+        self._current_user = None
 
     def refresh_token(self, refresh_token: str) -> RefreshTokenResponse:
         """Refresh access token"""
-        data = self._http.post("/auth/refresh", {"refreshToken": refresh_token})
-        response = RefreshTokenResponse(**data)
+        raw = self._http.post_raw("/auth/refresh", {"refreshToken": refresh_token})
+        response = RefreshTokenResponse.model_validate_json(raw)
         self._http.set_access_token(response.access_token)
         return response
 
-    def get_current_user(self) -> User:
-        """Get current user"""
-        data = self._http.get("/auth/me")
-        return User(**data)
+    def get_current_user(self, refresh: bool = False) -> User:
+        """Get current user, reusing the last response for the same credentials"""
+        credentials = (self._http.access_token, self._http.api_key)
+        if not refresh and self._current_user is not None:
+            cached_for, user = self._current_user
+            if cached_for == credentials:
+                return user
+
+        raw = self._http.get_raw("/auth/me")
+        user = User.model_validate_json(raw)
+        self._current_user = (credentials, user)
+        return user
 
 
 class ConversationsResource:
@@ -68,23 +240,39 @@ class ConversationsResource:
 
     def list(self, **params: Any) -> PaginatedResponse[Conversation]:
         """List conversations"""
-        data = self._http.get("/conversations", params=params)
-        return PaginatedResponse[Conversation](**data)
+        raw = self._http.get_raw("/conversations", params=params)
+        return _ConversationPage.model_validate_json(raw)
+
+    def iter_all(self, **params: Any) -> Iterator[Conversation]:
+        """Iterate over all conversations, prefetching the next page"""
+        return iter_items(self.list, params)
 
     def get(self, id: str) -> Conversation:
         """Get conversation"""
-        data = self._http.get(f"/conversations/{id}")
-        return Conversation(**data)
-
-    def update(self, id: str, **kwargs: Any) -> Conversation:
-        """Update conversation"""
-        data = self._http.patch(f"/conversations/{id}", kwargs)
-        return Conversation(**data)
-
-    def send_message(self, conversation_id: str, **kwargs: Any) -> Message:
-        """Send message"""
-        data = self._http.post(f"/conversations/{conversation_id}/messages", kwargs)
-        return Message(**data)
+        raw = self._http.get_raw(f"/conversations/{id}")
+        return Conversation.model_validate_json(raw)
+
+    def bulk_get(
+        self, ids: list[str], concurrency: int = BULK_GET_CONCURRENCY
+    ) -> list[Conversation]:
+        """Get several conversations concurrently over the connection pool"""
+        return _bulk_get(self.get, ids, concurrency)
+
+    def update(
+        self, id: str, payload: Optional[UpdateConversationInput] = None, **kwargs: Any
+    ) -> Conversation:
+        """Update conversation from an input model or keyword fields"""
+        body = _dump_input(UpdateConversationInput, kwargs, payload)
+        raw = self._http.patch_raw(f"/conversations/{id}", body)
+        return Conversation.model_validate_json(raw)
+
+    def send_message(
+        self, conversation_id: str, payload: Optional[SendMessageInput] = None, **kwargs: Any
+    ) -> Message:
+        """Send message from an input model or keyword fields"""
+        body = _dump_input(SendMessageInput, kwargs, payload)
+        raw = self._http.post_raw(f"/conversations/{conversation_id}/messages", body)
+        return Message.model_validate_json(raw)
 
     def send_text(self, conversation_id: str, text: str) -> Message:
         """Send text message"""
@@ -92,8 +280,12 @@ class ConversationsResource:
 
     def list_messages(self, conversation_id: str, **params: Any) -> PaginatedResponse[Message]:
         """List messages"""
-        data = self._http.get(f"/conversations/{conversation_id}/messages", params=params)
-        return PaginatedResponse[Message](**data)
+        raw = self._http.get_raw(f"/conversations/{conversation_id}/messages", params=params)
+        return _MessagePage.model_validate_json(raw)
+
+    def iter_messages(self, conversation_id: str, **params: Any) -> Iterator[Message]:
+        """Iterate over all messages, prefetching the next page"""
+        return iter_items(partial(self.list_messages, conversation_id), params)
 
     def resolve(self, id: str) -> Conversation:
         """Resolve conversation"""
@@ -101,115 +293,49 @@ class ConversationsResource:
 
     def assign(self, id: str, agent_id: str) -> Conversation:
         """Assign conversation"""
-        data = self._http.post(f"/conversations/{id}/assign", {"agentId": agent_id})
-        return Conversation(**data)
+        raw = self._http.post_raw(f"/conversations/{id}/assign", {"agentId": agent_id})
+        return Conversation.model_validate_json(raw)
 
 
-class ContactsResource:
+class ContactsResource(_CRUDResource[Contact]):
     """Contacts resource"""
 
-    def __init__(self, http: HttpClient):
-        self._http = http
-
-    def list(self, **params: Any) -> PaginatedResponse[Contact]:
-        """List contacts"""
-        data = self._http.get("/contacts", params=params)
-        return PaginatedResponse[Contact](**data)
-
-    def get(self, id: str) -> Contact:
-        """Get contact"""
-        data = self._http.get(f"/contacts/{id}")
-        return Contact(**data)
-
-    def create(self, **kwargs: Any) -> Contact:
-        """Create contact"""
-        data = self._http.post("/contacts", kwargs)
-        return Contact(**data)
-
-    def update(self, id: str, **kwargs: Any) -> Contact:
-        """Update contact"""
-        data = self._http.patch(f"/contacts/{id}", kwargs)
-        return Contact(**data)
-
-    def delete(self, id: str) -> None:
-        """Delete contact"""
-        self._http.delete(f"/contacts/{id}")
+    _path = "/contacts"
+    _model = Contact
+    _create_input = CreateContactInput
+    _update_input = UpdateContactInput
 
     def search(self, query: str, **params: Any) -> PaginatedResponse[Contact]:
         """Search contacts"""
         return self.list(search=query, **params)
 
 
-class ChannelsResource:
+class ChannelsResource(_CRUDResource[Channel]):
     """Channels resource"""
 
-    def __init__(self, http: HttpClient):
-        self._http = http
-
-    def list(self, **params: Any) -> PaginatedResponse[Channel]:
-        """List channels"""
-        data = self._http.get("/channels", params=params)
-        return PaginatedResponse[Channel](**data)
-
-    def get(self, id: str) -> Channel:
-        """Get channel"""
-        data = self._http.get(f"/channels/{id}")
-        return Channel(**data)
-
-    def create(self, **kwargs: Any) -> Channel:
-        """Create channel"""
-        data = self._http.post("/channels", kwargs)
-        return Channel(**data)
-
-    def update(self, id: str, **kwargs: Any) -> Channel:
-        """Update channel"""
-        data = self._http.patch(f"/channels/{id}", kwargs)
-        return Channel(**data)
-
-    def delete(self, id: str) -> None:
-        """Delete channel"""
-        self._http.delete(f"/channels/{id}")
+    _path = "/channels"
+    _model = Channel
+    _create_input = CreateChannelInput
+    _update_input = UpdateChannelInput
 
     def connect(self, id: str) -> Channel:
         """Connect channel"""
-        data = self._http.post(f"/channels/{id}/connect")
-        return Channel(**data)
+        raw = self._http.post_raw(f"/channels/{id}/connect")
+        return Channel.model_validate_json(raw)
 
     def disconnect(self, id: str) -> Channel:
         """Disconnect channel"""
-        data = self._http.post(f"/channels/{id}/disconnect")
-        return Channel(**data)
+        raw = self._http.post_raw(f"/channels/{id}/disconnect")
+        return Channel.model_validate_json(raw)
 
 
-class BotsResource:
+class BotsResource(_CRUDResource[Bot]):
     """Bots resource"""
 
-    def __init__(self, http: HttpClient):
-        self._http = http
-
-    def list(self, **params: Any) -> PaginatedResponse[Bot]:
-        """List bots"""
-        data = self._http.get("/bots", params=params)
-        return PaginatedResponse[Bot](**data)
-
-    def get(self, id: str) -> Bot:
-        """Get bot"""
-        data = self._http.get(f"/bots/{id}")
-        return Bot(**data)
-
-    def create(self, **kwargs: Any) -> Bot:
-        """Create bot"""
-        data = self._http.post("/bots", kwargs)
-        return Bot(**data)
-
-    def update(self, id: str, **kwargs: Any) -> Bot:
-        """Update bot"""
-        data = self._http.patch(f"/bots/{id}", kwargs)
-        return Bot(**data)
-
-    def delete(self, id: str) -> None:
-        """Delete bot"""
-        self._http.delete(f"/bots/{id}")
+    _path = "/bots"
+    _model = Bot
+    _create_input = CreateBotInput
+    _update_input = UpdateBotInput
 
     def activate(self, id: str) -> Bot:
         """Activate bot"""
@@ -230,39 +356,18 @@ class AIResource:
         self.embeddings = EmbeddingsSubResource(http)
 
 
-class AgentsSubResource:
+class AgentsSubResource(_CRUDResource[Agent]):
     """Agents sub-resource"""
 
-    def __init__(self, http: HttpClient):
-        self._http = http
-
-    def list(self, **params: Any) -> PaginatedResponse[Agent]:
-        """List agents"""
-        data = self._http.get("/ai/agents", params=params)
-        return PaginatedResponse[Agent](**data)
-
-    def get(self, id: str) -> Agent:
-        """Get agent"""
-        data = self._http.get(f"/ai/agents/{id}")
-        return Agent(**data)
-
-    def create(self, **kwargs: Any) -> Agent:
-        """Create agent"""
-        data = self._http.post("/ai/agents", kwargs)
-        return Agent(**data)
-
-    def update(self, id: str, **kwargs: Any) -> Agent:
-        """Update agent"""
-        data = self._http.patch(f"/ai/agents/{id}", kwargs)
-        return Agent(**data)
-
-    def delete(self, id: str) -> None:
-        """Delete agent"""
-        self._http.delete(f"/ai/agents/{id}")
+    _path = "/ai/agents"
+    _model = Agent
+    _create_input = CreateAgentInput
+    _update_input = UpdateAgentInput
 
     def invoke(self, id: str, message: str, **kwargs: Any) -> dict[str, Any]:
         """Invoke agent"""
-        return self._http.post(f"/ai/agents/{id}/invoke", {"message": message, **kwargs})
+        body = _dump_input(InvokeAgentInput, {"message": message, **kwargs})
+        return self._http.post(f"/ai/agents/{id}/invoke", body)
 
 
 class CompletionsSubResource:
@@ -280,6 +385,15 @@ class CompletionsSubResource:
         response = self.create([{"role": "user", "content": prompt}], **kwargs)
         return response["message"]["content"]
 
+    def stream(self, messages: list[dict[str, str]], **kwargs: Any) -> Iterator[str]:
+        """Stream completion tokens as they are generated"""
+        for chunk in self._http.stream(
+            "/ai/completions", {"messages": messages, **kwargs, "stream": True}
+        ):
+            content = chunk.get("delta", {}).get("content")
+            if content:
+                yield content
+
 
 class EmbeddingsSubResource:
     """Embeddings sub-resource"""
@@ -296,40 +410,24 @@ class EmbeddingsSubResource:
         response = self.create(text, **kwargs)
         return response["data"][0]["embedding"]
 
+    def embed_many(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        """Embed multiple texts in a single request"""
+        response = self.create(texts, **kwargs)
+        return [item["embedding"] for item in response["data"]]
 
-class KnowledgeBasesResource:
-    """Knowledge bases resource"""
 
-    def __init__(self, http: HttpClient):
-        self._http = http
-
-    def list(self, **params: Any) -> PaginatedResponse[KnowledgeBase]:
-        """List knowledge bases"""
-        data = self._http.get("/knowledge-bases", params=params)
-        return PaginatedResponse[KnowledgeBase](**data)
-
-    def get(self, id: str) -> KnowledgeBase:
-        """Get knowledge base"""
-        data = self._http.get(f"/knowledge-bases/{id}")
-        return KnowledgeBase(**data)
-
-    def create(self, **kwargs: Any) -> KnowledgeBase:
-        """Create knowledge base"""
-        data = self._http.post("/knowledge-bases", kwargs)
-        return KnowledgeBase(**data)
-
-    def update(self, id: str, **kwargs: Any) -> KnowledgeBase:
-        """Update knowledge base"""
-        data = self._http.patch(f"/knowledge-bases/{id}", kwargs)
-        return KnowledgeBase(**data)
+class KnowledgeBasesResource(_CRUDResource[KnowledgeBase]):
+    """Knowledge bases resource"""
 
-    def delete(self, id: str) -> None:
-        """Delete knowledge base"""
-        self._http.delete(f"/knowledge-bases/{id}")
+    _path = "/knowledge-bases"
+    _model = KnowledgeBase
+    _create_input = CreateKnowledgeBaseInput
+    _update_input = UpdateKnowledgeBaseInput
 
     def query(self, id: str, query: str, top_k: int = 5, **kwargs: Any) -> dict[str, Any]:
         """Query knowledge base"""
-        return self._http.post(f"/knowledge-bases/{id}/query", {"query": query, "topK": top_k, **kwargs})
+        body = _dump_input(QueryKnowledgeBaseInput, {"query": query, "top_k": top_k, **kwargs})
+        return self._http.post(f"/knowledge-bases/{id}/query", body)
 
     def search(self, id: str, query: str, top_k: int = 5) -> list[str]:
         """Simple search returning text results"""
@@ -338,53 +436,40 @@ class KnowledgeBasesResource:
 
     def list_documents(self, kb_id: str, **params: Any) -> PaginatedResponse[Document]:
         """List documents"""
-        data = self._http.get(f"/knowledge-bases/{kb_id}/documents", params=params)
-        return PaginatedResponse[Document](**data)
-
-    def upload_document(self, kb_id: str, file: bytes, filename: str, **kwargs: Any) -> Document:
-        """Upload document"""
-        data = self._http.upload(f"/knowledge-bases/{kb_id}/documents", file, filename, **kwargs)
-        return Document(**data)
+        raw = self._http.get_raw(f"/knowledge-bases/{kb_id}/documents", params=params)
+        return _DocumentPage.model_validate_json(raw)
+
+    def iter_documents(self, kb_id: str, **params: Any) -> Iterator[Document]:
+        """Iterate over all documents, prefetching the next page"""
+        return iter_items(partial(self.list_documents, kb_id), params)
+
+    def upload_document(
+        self, kb_id: str, file: FileInput, filename: str, **kwargs: Any
+    ) -> Document:
+        """Upload document from bytes, a binary file object or a file path"""
+        raw = self._http.upload_raw(
+            f"/knowledge-bases/{kb_id}/documents", file, filename, **kwargs
+        )
+        return Document.model_validate_json(raw)
 
     def delete_document(self, kb_id: str, doc_id: str) -> None:
         """Delete document"""
         self._http.delete(f"/knowledge-bases/{kb_id}/documents/{doc_id}")
 
 
-class FlowsResource:
+class FlowsResource(_CRUDResource[Flow]):
     """Flows resource"""
 
-    def __init__(self, http: HttpClient):
-        self._http = http
-
-    def list(self, **params: Any) -> PaginatedResponse[Flow]:
-        """List flows"""
-        data = self._http.get("/flows", params=params)
-        return PaginatedResponse[Flow](**data)
-
-    def get(self, id: str) -> Flow:
-        """Get flow"""
-        data = self._http.get(f"/flows/{id}")
-        return Flow(**data)
-
-    def create(self, **kwargs: Any) -> Flow:
-        """Create flow"""
-        data = self._http.post("/flows", kwargs)
-        return Flow(**data)
-
-    def update(self, id: str, **kwargs: Any) -> Flow:
-        """Update flow"""
-        data = self._http.patch(f"/flows/{id}", kwargs)
-        return Flow(**data)
-
-    def delete(self, id: str) -> None:
-        """Delete flow"""
-        self._http.delete(f"/flows/{id}")
+    _path = "/flows"
+    _model = Flow
+    _create_input = CreateFlowInput
+    _update_input = UpdateFlowInput
 
     def execute(self, id: str, conversation_id: str, **kwargs: Any) -> FlowExecution:
         """Execute flow"""
-        data = self._http.post(f"/flows/{id}/execute", {"conversationId": conversation_id, **kwargs})
-        return FlowExecution(**data)
+        body = _dump_input(ExecuteFlowInput, {"conversation_id": conversation_id, **kwargs})
+        raw = self._http.post_raw(f"/flows/{id}/execute", body)
+        return FlowExecution.model_validate_json(raw)
 
     def activate(self, id: str) -> Flow:
         """Activate flow"""
@@ -414,8 +499,8 @@ class AnalyticsResource:
         return self._http.get("/analytics/messages", params=params)
 
     def get_realtime(self) -> dict[str, Any]:
-        """Get realtime metrics"""
-        return self._http.get("/analytics/realtime")
+        """Get realtime metrics (served from the cache for at most a second if caching is on)"""
+        return self._http.get("/analytics/realtime", max_age=REALTIME_MAX_AGE)
 
 
 class VREResource:
@@ -451,24 +536,18 @@ class VREResource:
         Returns:
             VRERenderResponse with image_base64 and caption
         """
-        payload = {
-            "tenant_id": tenant_id,
-            "template_id": template_id,
-            "data": data,
-        }
-        if channel:
-            payload["channel"] = channel
-        if format:
-            payload["format"] = format
-        if width:
-            payload["width"] = width
-        if quality:
-            payload["quality"] = quality
-        if scale:
-            payload["scale"] = scale
-
-        response = self._http.post("/vre/render", payload)
-        return VRERenderResponse(**response)
+        payload = _compact(
+            tenant_id=tenant_id,
+            template_id=template_id,
+            data=data,
+            channel=channel,
+            format=format,
+            width=width,
+            quality=quality,
+            scale=scale,
+        )
+        raw = self._http.post_raw("/vre/render", payload)
+        return VRERenderResponse.model_validate_json(raw)
 
     def render_and_send(
         self,
@@ -491,18 +570,15 @@ class VREResource:
         Returns:
             VRERenderAndSendResponse with message_id
         """
-        payload = {
-            "conversation_id": conversation_id,
-            "template_id": template_id,
-            "data": data,
-        }
-        if caption:
-            payload["caption"] = caption
-        if follow_up_text:
-            payload["follow_up_text"] = follow_up_text
-
-        response = self._http.post("/vre/render-and-send", payload)
-        return VRERenderAndSendResponse(**response)
+        payload = _compact(
+            conversation_id=conversation_id,
+            template_id=template_id,
+            data=data,
+            caption=caption,
+            follow_up_text=follow_up_text,
+        )
+        raw = self._http.post_raw("/vre/render-and-send", payload)
+        return VRERenderAndSendResponse.model_validate_json(raw)
 
     def list_templates(self, tenant_id: Optional[str] = None) -> VREListTemplatesResponse:
         """
@@ -514,11 +590,9 @@ class VREResource:
         Returns:
             VREListTemplatesResponse with templates list
         """
-        params = {}
-        if tenant_id:
-            params["tenant_id"] = tenant_id
-        response = self._http.get("/vre/templates", params=params if params else None)
-        return VREListTemplatesResponse(**response)
+        params = _compact(tenant_id=tenant_id)
+        raw = self._http.get_raw("/vre/templates", params=params or None)
+        return VREListTemplatesResponse.model_validate_json(raw)
 
     def preview(
         self, template_id: str, data: Optional[dict[str, Any]] = None
@@ -533,11 +607,9 @@ class VREResource:
         Returns:
             VREPreviewResponse with image_base64
         """
-        payload = {}
-        if data:
-            payload["data"] = data
-        response = self._http.post(f"/vre/templates/{template_id}/preview", payload if payload else None)
-        return VREPreviewResponse(**response)
+        payload = _compact(data=data)
+        raw = self._http.post_raw(f"/vre/templates/{template_id}/preview", payload or None)
+        return VREPreviewResponse.model_validate_json(raw)
 
     # Convenience methods
 
@@ -562,9 +634,7 @@ class VREResource:
         Returns:
             VRERenderResponse
         """
-        data = {"titulo": titulo, "opcoes": opcoes}
-        if subtitulo:
-            data["subtitulo"] = subtitulo
+        data = _compact(titulo=titulo, opcoes=opcoes, subtitulo=subtitulo)
         return self.render(tenant_id, "menu_opcoes", data, channel=channel)
 
     def render_product_card(
@@ -596,15 +666,15 @@ class VREResource:
         Returns:
             VRERenderResponse
         """
-        data: dict[str, Any] = {"nome": nome, "preco": preco, "unidade": unidade}
-        if sku:
-            data["sku"] = sku
-        if estoque is not None:
-            data["estoque"] = estoque
-        if imagem_url:
-            data["imagem_url"] = imagem_url
-        if destaque:
-            data["destaque"] = destaque
+        data = _compact(
+            nome=nome,
+            preco=preco,
+            unidade=unidade,
+            sku=sku,
+            estoque=estoque,
+            imagem_url=imagem_url,
+            destaque=destaque,
+        )
         return self.render(tenant_id, "card_produto", data, channel=channel)
 
     def render_order_status(
@@ -634,18 +704,14 @@ class VREResource:
         Returns:
             VRERenderResponse
         """
-        data: dict[str, Any] = {
-            "numero_pedido": numero_pedido,
-            "status_atual": status_atual,
-        }
-        if itens_resumo:
-            data["itens_resumo"] = itens_resumo
-        if valor_total is not None:
-            data["valor_total"] = valor_total
-        if previsao_entrega:
-            data["previsao_entrega"] = previsao_entrega
-        if motorista:
-            data["motorista"] = motorista
+        data = _compact(
+            numero_pedido=numero_pedido,
+            status_atual=status_atual,
+            itens_resumo=itens_resumo,
+            valor_total=valor_total,
+            previsao_entrega=previsao_entrega,
+            motorista=motorista,
+        )
         return self.render(tenant_id, "status_pedido", data, channel=channel)
 
     def render_product_list(
@@ -669,9 +735,7 @@ class VREResource:
         Returns:
             VRERenderResponse
         """
-        data: dict[str, Any] = {"titulo": titulo, "produtos": produtos}
-        if mensagem:
-            data["mensagem"] = mensagem
+        data = _compact(titulo=titulo, produtos=produtos, mensagem=mensagem)
         return self.render(tenant_id, "lista_produtos", data, channel=channel)
 
     def render_confirmation(
@@ -701,15 +765,14 @@ class VREResource:
         Returns:
             VRERenderResponse
         """
-        data: dict[str, Any] = {"valor_total": valor_total, "itens": itens}
-        if titulo:
-            data["titulo"] = titulo
-        if subtitulo:
-            data["subtitulo"] = subtitulo
-        if previsao_entrega:
-            data["previsao_entrega"] = previsao_entrega
-        if mensagem:
-            data["mensagem"] = mensagem
+        data = _compact(
+            valor_total=valor_total,
+            itens=itens,
+            titulo=titulo,
+            subtitulo=subtitulo,
+            previsao_entrega=previsao_entrega,
+            mensagem=mensagem,
+        )
         return self.render(tenant_id, "confirmacao", data, channel=channel)
 
     def render_pix_payment(
@@ -737,15 +800,744 @@ class VREResource:
         Returns:
             VRERenderResponse
         """
-        data: dict[str, Any] = {"valor": valor, "pix_payload": pix_payload}
-        if numero_pedido:
-            data["numero_pedido"] = numero_pedido
-        if expiracao:
-            data["expiracao"] = expiracao
-        if mensagem:
-            data["mensagem"] = mensagem
+        data = _compact(
+            valor=valor,
+            pix_payload=pix_payload,
+            numero_pedido=numero_pedido,
+            expiracao=expiracao,
+            mensagem=mensagem,
+        )
         return self.render(tenant_id, "cobranca_pix", data, channel=channel)
 
+    def render_pix_payment_local(
+        self,
+        pix_payload: str,
+        format: VREOutputFormat | str = VREOutputFormat.PNG,
+        size: int = 512,
+    ) -> bytes:
+        """
+        Render a bare PIX QR code locally, without calling the API.
+
+        Use this when only the QR image is needed; use render_pix_payment for
+        the branded payment template. Requires the ``qr`` extra.
+
+        Args:
+            pix_payload: PIX EMV/BRCode payload
+            format: Image format
+            size: Image width and height in pixels
+
+        Returns:
+            Encoded image bytes
+        """
+        return render_qr(pix_payload, VREOutputFormat(format).value, size)
+
+
+class _AsyncCRUDResource(Generic[ModelT]):
+    """Async counterpart of _CRUDResource"""
+
+    _path: str
+    _model: type[ModelT]
+    _page_model: type[PaginatedResponse[ModelT]]
+    _create_input: type[BaseModel]
+    _update_input: type[BaseModel]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._page_model = PaginatedResponse[cls._model]
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+
+    async def list(self, **params: Any) -> PaginatedResponse[ModelT]:
+        """List resources"""
+        raw = await self._http.get_raw(self._path, params=params)
+        return self._page_model.model_validate_json(raw)
+
+    def iter_all(self, **params: Any) -> AsyncIterator[ModelT]:
+        """Iterate over all resources, prefetching the next page"""
+        return aiter_items(self.list, params)
+
+    async def get(self, id: str) -> ModelT:
+        """Get resource"""
+        raw = await self._http.get_raw(f"{self._path}/{id}")
+        return self._model.model_validate_json(raw)
+
+    async def create(self, payload: Optional[BaseModel] = None, **kwargs: Any) -> ModelT:
+        """Create resource from an input model or keyword fields"""
+        body = _dump_input(self._create_input, kwargs, payload)
+        raw = await self._http.post_raw(self._path, body)
+        return self._model.model_validate_json(raw)
+
+    async def update(
+        self, id: str, payload: Optional[BaseModel] = None, **kwargs: Any
+    ) -> ModelT:
+        """Update resource from an input model or keyword fields"""
+        body = _dump_input(self._update_input, kwargs, payload)
+        raw = await self._http.patch_raw(f"{self._path}/{id}", body)
+        return self._model.model_validate_json(raw)
+
+    async def delete(self, id: str) -> None:
+        """Delete resource"""
+        await self._http.delete(f"{self._path}/{id}")
+
+    async def bulk_get(
+        self, ids: list[str], concurrency: int = BULK_GET_CONCURRENCY
+    ) -> list[ModelT]:
+        """Get several resources concurrently"""
+        return await _abulk_get(self.get, ids, concurrency)
+
+
+class AsyncAuthResource:
+    """Auth resource (async)"""
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+        self._current_user: Optional[tuple[tuple[Optional[str], Optional[str]], User]] = None
+
+    async def login(self, email: str, password: str) -> LoginResponse:
+        """Login with email and password"""
+        raw = await self._http.post_raw("/auth/login", {"email": email, "password": password})
+        response = LoginResponse.model_validate_json(raw)
+        self._http.set_access_token(response.access_token)
+        return response
+
+    async def logout(self) -> None:
+        """Logout"""
+        await self._http.post("/auth/logout")
+        self._current_user = None
+
+    async def refresh_token(self, refresh_token: str) -> RefreshTokenResponse:
+        """Refresh access token"""
+        raw = await self._http.post_raw("/auth/refresh", {"refreshToken": refresh_token})
+        response = RefreshTokenResponse.model_validate_json(raw)
+        self._http.set_access_token(response.access_token)
+        return response
+
+    async def get_current_user(self, refresh: bool = False) -> User:
+        """Get current user, reusing the last response for the same credentials"""
+        credentials = (self._http.access_token, self._http.api_key)
+        if not refresh and self._current_user is not None:
+            cached_for, user = self._current_user
+            if cached_for == credentials:
+                return user
+
+        raw = await self._http.get_raw("/auth/me")
+        user = User.model_validate_json(raw)
+        self._current_user = (credentials, user)
+        return user
+
+
+class AsyncConversationsResource:
+    """Conversations resource (async)"""
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+
+    async def list(self, **params: Any) -> PaginatedResponse[Conversation]:
+        """List conversations"""
+        raw = await self._http.get_raw("/conversations", params=params)
+        return _ConversationPage.model_validate_json(raw)
+
+    def iter_all(self, **params: Any) -> AsyncIterator[Conversation]:
+        """Iterate over all conversations, prefetching the next page"""
+        return aiter_items(self.list, params)
+
+    async def get(self, id: str) -> Conversation:
+        """Get conversation"""
+        raw = await self._http.get_raw(f"/conversations/{id}")
+        return Conversation.model_validate_json(raw)
+
+    async def bulk_get(
+        self, ids: list[str], concurrency: int = BULK_GET_CONCURRENCY
+    ) -> list[Conversation]:
+        """Get several conversations concurrently"""
+        return await _abulk_get(self.get, ids, concurrency)
+
+    async def update(
+        self, id: str, payload: Optional[UpdateConversationInput] = None, **kwargs: Any
+    ) -> Conversation:
+        """Update conversation from an input model or keyword fields"""
+        body = _dump_input(UpdateConversationInput, kwargs, payload)
+        raw = await self._http.patch_raw(f"/conversations/{id}", body)
+        return Conversation.model_validate_json(raw)
+
+    async def send_message(
+        self, conversation_id: str, payload: Optional[SendMessageInput] = None, **kwargs: Any
+    ) -> Message:
+        """Send message from an input model or keyword fields"""
+        body = _dump_input(SendMessageInput, kwargs, payload)
+        raw = await self._http.post_raw(f"/conversations/{conversation_id}/messages", body)
+        return Message.model_validate_json(raw)
+
+    async def send_text(self, conversation_id: str, text: str) -> Message:
+        """Send text message"""
+        return await self.send_message(conversation_id, text=text)
+
+    async def list_messages(
+        self, conversation_id: str, **params: Any
+    ) -> PaginatedResponse[Message]:
+        """List messages"""
+        raw = await self._http.get_raw(
+            f"/conversations/{conversation_id}/messages", params=params
+        )
+        return _MessagePage.model_validate_json(raw)
+
+    def iter_messages(self, conversation_id: str, **params: Any) -> AsyncIterator[Message]:
+        """Iterate over all messages, prefetching the next page"""
+        return aiter_items(partial(self.list_messages, conversation_id), params)
+
+    async def resolve(self, id: str) -> Conversation:
+        """Resolve conversation"""
+        return await self.update(id, status="resolved")
+
+    async def assign(self, id: str, agent_id: str) -> Conversation:
+        """Assign conversation"""
+        raw = await self._http.post_raw(f"/conversations/{id}/assign", {"agentId": agent_id})
+        return Conversation.model_validate_json(raw)
+
+
+class AsyncContactsResource(_AsyncCRUDResource[Contact]):
+    """Contacts resource (async)"""
+
+    _path = "/contacts"
+    _model = Contact
+    _create_input = CreateContactInput
+    _update_input = UpdateContactInput
+
+    async def search(self, query: str, **params: Any) -> PaginatedResponse[Contact]:
+        """Search contacts"""
+        return await self.list(search=query, **params)
+
+
+class AsyncChannelsResource(_AsyncCRUDResource[Channel]):
+    """Channels resource (async)"""
+
+    _path = "/channels"
+    _model = Channel
+    _create_input = CreateChannelInput
+    _update_input = UpdateChannelInput
+
+    async def connect(self, id: str) -> Channel:
+        """Connect channel"""
+        raw = await self._http.post_raw(f"/channels/{id}/connect")
+        return Channel.model_validate_json(raw)
+
+    async def disconnect(self, id: str) -> Channel:
+        """Disconnect channel"""
+        raw = await self._http.post_raw(f"/channels/{id}/disconnect")
+        return Channel.model_validate_json(raw)
+
+
+class AsyncBotsResource(_AsyncCRUDResource[Bot]):
+    """Bots resource (async)"""
+
+    _path = "/bots"
+    _model = Bot
+    _create_input = CreateBotInput
+    _update_input = UpdateBotInput
+
+    async def activate(self, id: str) -> Bot:
+        """Activate bot"""
+        return await self.update(id, status="active")
+
+    async def deactivate(self, id: str) -> Bot:
+        """Deactivate bot"""
+        return await self.update(id, status="inactive")
+
+
+class AsyncAgentsSubResource(_AsyncCRUDResource[Agent]):
+    """Agents sub-resource (async)"""
+
+    _path = "/ai/agents"
+    _model = Agent
+    _create_input = CreateAgentInput
+    _update_input = UpdateAgentInput
+
+    async def invoke(self, id: str, message: str, **kwargs: Any) -> dict[str, Any]:
+        """Invoke agent"""
+        body = _dump_input(InvokeAgentInput, {"message": message, **kwargs})
+        return await self._http.post(f"/ai/agents/{id}/invoke", body)
+
+
+class AsyncKnowledgeBasesResource(_AsyncCRUDResource[KnowledgeBase]):
+    """Knowledge bases resource (async)"""
+
+    _path = "/knowledge-bases"
+    _model = KnowledgeBase
+    _create_input = CreateKnowledgeBaseInput
+    _update_input = UpdateKnowledgeBaseInput
+
+    async def query(self, id: str, query: str, top_k: int = 5, **kwargs: Any) -> dict[str, Any]:
+        """Query knowledge base"""
+        body = _dump_input(QueryKnowledgeBaseInput, {"query": query, "top_k": top_k, **kwargs})
+        return await self._http.post(f"/knowledge-bases/{id}/query", body)
+
+    async def search(self, id: str, query: str, top_k: int = 5) -> list[str]:
+        """Simple search returning text results"""
+        result = await self.query(id, query, top_k)
+        return [chunk["content"] for chunk in result.get("chunks", [])]
+
+    async def list_documents(self, kb_id: str, **params: Any) -> PaginatedResponse[Document]:
+        """List documents"""
+        raw = await self._http.get_raw(f"/knowledge-bases/{kb_id}/documents", params=params)
+        return _DocumentPage.model_validate_json(raw)
+
+    def iter_documents(self, kb_id: str, **params: Any) -> AsyncIterator[Document]:
+        """Iterate over all documents, prefetching the next page"""
+        return aiter_items(partial(self.list_documents, kb_id), params)
+
+    async def upload_document(
+        self, kb_id: str, file: FileInput, filename: str, **kwargs: Any
+    ) -> Document:
+        """Upload document from bytes, a binary file object or a file path"""
+        raw = await self._http.upload_raw(
+            f"/knowledge-bases/{kb_id}/documents", file, filename, **kwargs
+        )
+        return Document.model_validate_json(raw)
+
+    async def delete_document(self, kb_id: str, doc_id: str) -> None:
+        """Delete document"""
+        await self._http.delete(f"/knowledge-bases/{kb_id}/documents/{doc_id}")
+
+
+class AsyncFlowsResource(_AsyncCRUDResource[Flow]):
+    """Flows resource (async)"""
+
+    _path = "/flows"
+    _model = Flow
+    _create_input = CreateFlowInput
+    _update_input = UpdateFlowInput
+
+    async def execute(self, id: str, conversation_id: str, **kwargs: Any) -> FlowExecution:
+        """Execute flow"""
+        body = _dump_input(ExecuteFlowInput, {"conversation_id": conversation_id, **kwargs})
+        raw = await self._http.post_raw(f"/flows/{id}/execute", body)
+        return FlowExecution.model_validate_json(raw)
+
+    async def activate(self, id: str) -> Flow:
+        """Activate flow"""
+        return await self.update(id, status="active")
+
+    async def deactivate(self, id: str) -> Flow:
+        """Deactivate flow"""
+        return await self.update(id, status="inactive")
+
+
+class AsyncAnalyticsResource:
+    """Analytics resource (async)"""
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+
+    async def get_dashboard(self, **params: Any) -> dict[str, Any]:
+        """Get dashboard metrics"""
+        return await self._http.get("/analytics/dashboard", params=params)
+
+    async def get_conversation_metrics(self, **params: Any) -> dict[str, Any]:
+        """Get conversation metrics"""
+        return await self._http.get("/analytics/conversations", params=params)
+
+    async def get_message_metrics(self, **params: Any) -> dict[str, Any]:
+        """Get message metrics"""
+        return await self._http.get("/analytics/messages", params=params)
+
+    async def get_realtime(self) -> dict[str, Any]:
+        """Get realtime metrics (never cached; the async client has no GET cache)"""
+        return await self._http.get("/analytics/realtime")
+
+
+class AsyncVREResource:
+    """VRE (Visual Response Engine) resource (async)"""
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+
+    async def render(
+        self,
+        tenant_id: str,
+        template_id: str,
+        data: dict[str, Any],
+        channel: Optional[str] = None,
+        format: Optional[str] = None,
+        width: Optional[int] = None,
+        quality: Optional[int] = None,
+        scale: Optional[float] = None,
+    ) -> VRERenderResponse:
+        """
+        Render a VRE template to an image.
+
+        Args:
+            tenant_id: Tenant ID
+            template_id: Template to render (menu_opcoes, card_produto, etc.)
+            data: Template data
+            channel: Target channel for optimization (whatsapp, telegram, web, email)
+            format: Output format (png, webp, jpeg)
+            width: Override default width
+            quality: Quality 0-100 (for webp/jpeg)
+            scale: Scale factor (1.0-2.0)
+
+        Returns:
+            VRERenderResponse with image_base64 and caption
+        """
+        payload = _compact(
+            tenant_id=tenant_id,
+            template_id=template_id,
+            data=data,
+            channel=channel,
+            format=format,
+            width=width,
+            quality=quality,
+            scale=scale,
+        )
+        raw = await self._http.post_raw("/vre/render", payload)
+        return VRERenderResponse.model_validate_json(raw)
+
+    async def render_and_send(
+        self,
+        conversation_id: str,
+        template_id: str,
+        data: dict[str, Any],
+        caption: Optional[str] = None,
+        follow_up_text: Optional[str] = None,
+    ) -> VRERenderAndSendResponse:
+        """
+        Render a template and send it directly to a conversation.
+
+        Args:
+            conversation_id: Conversation to send to
+            template_id: Template to render
+            data: Template data
+            caption: Optional custom caption
+            follow_up_text: Optional text to send after the image
+
+        Returns:
+            VRERenderAndSendResponse with message_id
+        """
+        payload = _compact(
+            conversation_id=conversation_id,
+            template_id=template_id,
+            data=data,
+            caption=caption,
+            follow_up_text=follow_up_text,
+        )
+        raw = await self._http.post_raw("/vre/render-and-send", payload)
+        return VRERenderAndSendResponse.model_validate_json(raw)
+
+    async def list_templates(self, tenant_id: Optional[str] = None) -> VREListTemplatesResponse:
+        """
+        List available VRE templates.
+
+        Args:
+            tenant_id: Optional tenant ID to include custom templates
+
+        Returns:
+            VREListTemplatesResponse with templates list
+        """
+        params = _compact(tenant_id=tenant_id)
+        raw = await self._http.get_raw("/vre/templates", params=params or None)
+        return VREListTemplatesResponse.model_validate_json(raw)
+
+    async def preview(
+        self, template_id: str, data: Optional[dict[str, Any]] = None
+    ) -> VREPreviewResponse:
+        """
+        Preview a VRE template with sample data.
+
+        Args:
+            template_id: Template to preview
+            data: Optional custom data (uses defaults if not provided)
+
+        Returns:
+            VREPreviewResponse with image_base64
+        """
+        payload = _compact(data=data)
+        raw = await self._http.post_raw(f"/vre/templates/{template_id}/preview", payload or None)
+        return VREPreviewResponse.model_validate_json(raw)
+
+    # Convenience methods
+
+    async def render_menu(
+        self,
+        tenant_id: str,
+        titulo: str,
+        opcoes: list[dict[str, Any]],
+        subtitulo: Optional[str] = None,
+        channel: str = "whatsapp",
+    ) -> VRERenderResponse:
+        """
+        Render a menu with numbered options.
+
+        Args:
+            tenant_id: Tenant ID
+            titulo: Menu title
+            opcoes: List of options with label, icone, descricao
+            subtitulo: Optional subtitle
+            channel: Target channel
+
+        Returns:
+            VRERenderResponse
+        """
+        data = _compact(titulo=titulo, opcoes=opcoes, subtitulo=subtitulo)
+        return await self.render(tenant_id, "menu_opcoes", data, channel=channel)
+
+    async def render_product_card(
+        self,
+        tenant_id: str,
+        nome: str,
+        preco: float,
+        unidade: str,
+        sku: Optional[str] = None,
+        estoque: Optional[int] = None,
+        imagem_url: Optional[str] = None,
+        destaque: Optional[str] = None,
+        channel: str = "whatsapp",
+    ) -> VRERenderResponse:
+        """
+        Render a product card.
+
+        Args:
+            tenant_id: Tenant ID
+            nome: Product name
+            preco: Product price
+            unidade: Unit (kg, un, cx, etc.)
+            sku: Product SKU
+            estoque: Stock quantity
+            imagem_url: Product image URL
+            destaque: Highlight badge
+            channel: Target channel
+
+        Returns:
+            VRERenderResponse
+        """
+        data = _compact(
+            nome=nome,
+            preco=preco,
+            unidade=unidade,
+            sku=sku,
+            estoque=estoque,
+            imagem_url=imagem_url,
+            destaque=destaque,
+        )
+        return await self.render(tenant_id, "card_produto", data, channel=channel)
+
+    async def render_order_status(
+        self,
+        tenant_id: str,
+        numero_pedido: str,
+        status_atual: str,
+        itens_resumo: Optional[str] = None,
+        valor_total: Optional[float] = None,
+        previsao_entrega: Optional[str] = None,
+        motorista: Optional[str] = None,
+        channel: str = "whatsapp",
+    ) -> VRERenderResponse:
+        """
+        Render an order status timeline.
+
+        Args:
+            tenant_id: Tenant ID
+            numero_pedido: Order number
+            status_atual: Current status (recebido, separacao, faturado, transporte, entregue)
+            itens_resumo: Items summary
+            valor_total: Total value
+            previsao_entrega: Delivery estimate
+            motorista: Driver name
+            channel: Target channel
+
+        Returns:
+            VRERenderResponse
+        """
+        data = _compact(
+            numero_pedido=numero_pedido,
+            status_atual=status_atual,
+            itens_resumo=itens_resumo,
+            valor_total=valor_total,
+            previsao_entrega=previsao_entrega,
+            motorista=motorista,
+        )
+        return await self.render(tenant_id, "status_pedido", data, channel=channel)
+
+    async def render_product_list(
+        self,
+        tenant_id: str,
+        titulo: str,
+        produtos: list[dict[str, Any]],
+        mensagem: Optional[str] = None,
+        channel: str = "whatsapp",
+    ) -> VRERenderResponse:
+        """
+        Render a product list for comparison.
+
+        Args:
+            tenant_id: Tenant ID
+            titulo: List title
+            produtos: List of products with nome, preco, unidade, etc.
+            mensagem: Optional message
+            channel: Target channel
+
+        Returns:
+            VRERenderResponse
+        """
+        data = _compact(titulo=titulo, produtos=produtos, mensagem=mensagem)
+        return await self.render(tenant_id, "lista_produtos", data, channel=channel)
+
+    async def render_confirmation(
+        self,
+        tenant_id: str,
+        valor_total: float,
+        itens: list[dict[str, Any]],
+        titulo: Optional[str] = None,
+        subtitulo: Optional[str] = None,
+        previsao_entrega: Optional[str] = None,
+        mensagem: Optional[str] = None,
+        channel: str = "whatsapp",
+    ) -> VRERenderResponse:
+        """
+        Render a confirmation summary.
+
+        Args:
+            tenant_id: Tenant ID
+            valor_total: Total value
+            itens: List of items with nome, quantidade, preco
+            titulo: Confirmation title
+            subtitulo: Subtitle
+            previsao_entrega: Delivery estimate
+            mensagem: Optional message
+            channel: Target channel
+
+        Returns:
+            VRERenderResponse
+        """
+        data = _compact(
+            valor_total=valor_total,
+            itens=itens,
+            titulo=titulo,
+            subtitulo=subtitulo,
+            previsao_entrega=previsao_entrega,
+            mensagem=mensagem,
+        )
+        return await self.render(tenant_id, "confirmacao", data, channel=channel)
+
+    async def render_pix_payment(
+        self,
+        tenant_id: str,
+        valor: float,
+        pix_payload: str,
+        numero_pedido: Optional[str] = None,
+        expiracao: Optional[str] = None,
+        mensagem: Optional[str] = None,
+        channel: str = "whatsapp",
+    ) -> VRERenderResponse:
+        """
+        Render a PIX payment QR code.
+
+        Args:
+            tenant_id: Tenant ID
+            valor: Payment amount
+            pix_payload: PIX EMV/BRCode payload
+            numero_pedido: Order number
+            expiracao: Expiration time
+            mensagem: Optional message
+            channel: Target channel
+
+        Returns:
+            VRERenderResponse
+        """
+        data = _compact(
+            valor=valor,
+            pix_payload=pix_payload,
+            numero_pedido=numero_pedido,
+            expiracao=expiracao,
+            mensagem=mensagem,
+        )
+        return await self.render(tenant_id, "cobranca_pix", data, channel=channel)
+
+    async def render_pix_payment_local(
+        self,
+        pix_payload: str,
+        format: VREOutputFormat | str = VREOutputFormat.PNG,
+        size: int = 512,
+    ) -> bytes:
+        """
+        Render a bare PIX QR code locally, without calling the API.
+
+        Use this when only the QR image is needed; use render_pix_payment for
+        the branded payment template. Requires the ``qr`` extra.
+
+        Args:
+            pix_payload: PIX EMV/BRCode payload
+            format: Image format
+            size: Image width and height in pixels
+
+        Returns:
+            Encoded image bytes
+        """
+        return await asyncio.to_thread(
+            render_qr, pix_payload, VREOutputFormat(format).value, size
+        )
+
+
+class AsyncAIResource:
+    """AI resource (async)"""
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+        self.agents = AsyncAgentsSubResource(http)
+        self.completions = AsyncCompletionsSubResource(http)
+        self.embeddings = AsyncEmbeddingsSubResource(http)
+
+
+class AsyncCompletionsSubResource:
+    """Completions sub-resource (async)"""
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+
+    async def create(self, messages: list[dict[str, str]], **kwargs: Any) -> dict[str, Any]:
+        """Create completion"""
+        return await self._http.post("/ai/completions", {"messages": messages, **kwargs})
+
+    async def complete(self, prompt: str, **kwargs: Any) -> str:
+        """Simple completion"""
+        response = await self.create([{"role": "user", "content": prompt}], **kwargs)
+        return response["message"]["content"]
+
+    async def stream(self, messages: list[dict[str, str]], **kwargs: Any) -> AsyncIterator[str]:
+        """Stream completion tokens as they are generated"""
+        async for chunk in self._http.stream(
+            "/ai/completions", {"messages": messages, **kwargs, "stream": True}
+        ):
+            content = chunk.get("delta", {}).get("content")
+            if content:
+                yield content
+
+    async def complete_many(
+        self, prompts: list[str], concurrency: int = BULK_GET_CONCURRENCY, **kwargs: Any
+    ) -> list[str]:
+        """Run several simple completions concurrently"""
+        return await _abulk_get(lambda p: self.complete(p, **kwargs), prompts, concurrency)
+
+
+class AsyncEmbeddingsSubResource:
+    """Embeddings sub-resource (async)"""
+
+    def __init__(self, http: AsyncHttpClient):
+        self._http = http
+
+    async def create(self, input: str | list[str], **kwargs: Any) -> dict[str, Any]:
+        """Create embeddings"""
+        return await self._http.post("/ai/embeddings", {"input": input, **kwargs})
+
+    async def embed(self, text: str, **kwargs: Any) -> list[float]:
+        """Embed single text"""
+        response = await self.create(text, **kwargs)
+        return response["data"][0]["embedding"]
+
+    async def embed_many(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        """Embed multiple texts in a single request"""
+        response = await self.create(texts, **kwargs)
+        return [item["embedding"] for item in response["data"]]
+
 
 class LinktorClient:
     """Linktor SDK Client (Synchronous)"""
@@ -760,6 +1552,12 @@ class LinktorClient:
         retry_delay: float = 1.0,
         headers: Optional[dict[str, str]] = None,
         on_token_refresh: Optional[Callable[[], str]] = None,
+        share_pool: bool = False,
+        cache_ttl: float = 0.0,
+        cache_stale_on_error: bool = False,
+        http2: bool = False,
+        pool_max_connections: Optional[int] = DEFAULT_LIMITS.max_connections,
+        pool_max_keepalive: Optional[int] = DEFAULT_LIMITS.max_keepalive_connections,
     ):
         self._http = HttpClient(
             base_url=base_url,
@@ -770,6 +1568,11 @@ class LinktorClient:
             retry_delay=retry_delay,
             headers=headers,
             on_token_refresh=on_token_refresh,
+            share_pool=share_pool,
+            cache_ttl=cache_ttl,
+            cache_stale_on_error=cache_stale_on_error,
+            http2=http2,
+            limits=pool_limits(pool_max_connections, pool_max_keepalive),
         )
 
         self.auth = AuthResource(self._http)
@@ -814,6 +1617,10 @@ class LinktorAsyncClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         headers: Optional[dict[str, str]] = None,
+        on_token_refresh: Optional[Callable[[], str | Awaitable[str]]] = None,
+        http2: bool = False,
+        pool_max_connections: Optional[int] = DEFAULT_LIMITS.max_connections,
+        pool_max_keepalive: Optional[int] = DEFAULT_LIMITS.max_keepalive_connections,
     ):
         self._http = AsyncHttpClient(
             base_url=base_url,
@@ -823,9 +1630,29 @@ class LinktorAsyncClient:
             max_retries=max_retries,
             retry_delay=retry_delay,
             headers=headers,
+            on_token_refresh=on_token_refresh,
+            http2=http2,
+            limits=pool_limits(pool_max_connections, pool_max_keepalive),
         )
-        # Async resources would be similar but use async methods
-        # For brevity, omitting full async implementation
+
+        self.auth = AsyncAuthResource(self._http)
+        self.conversations = AsyncConversationsResource(self._http)
+        self.contacts = AsyncContactsResource(self._http)
+        self.channels = AsyncChannelsResource(self._http)
+        self.bots = AsyncBotsResource(self._http)
+        self.ai = AsyncAIResource(self._http)
+        self.knowledge_bases = AsyncKnowledgeBasesResource(self._http)
+        self.flows = AsyncFlowsResource(self._http)
+        self.analytics = AsyncAnalyticsResource(self._http)
+        self.vre = AsyncVREResource(self._http)
+
+    def set_api_key(self, api_key: str) -> None:
+        """Set API key"""
+        self._http.set_api_key(api_key)
+
+    def set_access_token(self, access_token: str) -> None:
+        """Set access token"""
+        self._http.set_access_token(access_token)
 
     async def close(self) -> None:
         """Close client"""
@@ -5,9 +5,14 @@ AI/Agent types
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from linktor.types.common import PaginationParams
+from linktor.types.common import (
+    CAMEL_CASE_CONFIG,
+    DEFERRED_CONFIG,
+    DEFERRED_CAMEL_CASE_CONFIG,
+    PaginationParams,
+)
 
 
 class AgentStatus(str, Enum):
@@ -42,22 +47,21 @@ class Agent(BaseModel):
     """Agent model"""
 
     id: str
-    tenant_id: str = Field(alias="tenantId")
+    tenant_id: str
     name: str
     description: Optional[str] = None
     status: AgentStatus
     model: str
-    system_prompt: Optional[str] = Field(None, alias="systemPrompt")
+    system_prompt: Optional[str] = None
     temperature: float
-    max_tokens: int = Field(alias="maxTokens")
+    max_tokens: int
     tools: Optional[list[AgentTool]] = None
-    knowledge_base_ids: Optional[list[str]] = Field(None, alias="knowledgeBaseIds")
+    knowledge_base_ids: Optional[list[str]] = None
     metadata: Optional[dict[str, Any]] = None
-    created_at: datetime = Field(alias="createdAt")
-    updated_at: datetime = Field(alias="updatedAt")
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class ChatMessage(BaseModel):
@@ -66,39 +70,36 @@ class ChatMessage(BaseModel):
     role: str  # system, user, assistant, tool
     content: str
     name: Optional[str] = None
-    tool_call_id: Optional[str] = Field(None, alias="toolCallId")
-    tool_calls: Optional[list[dict[str, Any]]] = Field(None, alias="toolCalls")
+    tool_call_id: Optional[str] = None
+    tool_calls: Optional[list[dict[str, Any]]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class TokenUsage(BaseModel):
     """Token usage statistics"""
 
-    prompt_tokens: int = Field(alias="promptTokens")
-    completion_tokens: int = Field(alias="completionTokens")
-    total_tokens: int = Field(alias="totalTokens")
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class CompletionRequest(BaseModel):
     """Completion request"""
 
-    agent_id: Optional[str] = Field(None, alias="agentId")
+    agent_id: Optional[str] = None
     model: Optional[str] = None
     messages: list[ChatMessage]
     temperature: Optional[float] = None
-    max_tokens: Optional[int] = Field(None, alias="maxTokens")
+    max_tokens: Optional[int] = None
     stream: Optional[bool] = None
     tools: Optional[list[AgentTool]] = None
-    knowledge_base_ids: Optional[list[str]] = Field(None, alias="knowledgeBaseIds")
-    conversation_id: Optional[str] = Field(None, alias="conversationId")
+    knowledge_base_ids: Optional[list[str]] = None
+    conversation_id: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 class CompletionResponse(BaseModel):
@@ -108,10 +109,9 @@ class CompletionResponse(BaseModel):
     model: str
     message: ChatMessage
     usage: TokenUsage
-    finish_reason: str = Field(alias="finishReason")
+    finish_reason: str
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class CompletionChunk(BaseModel):
@@ -119,10 +119,9 @@ class CompletionChunk(BaseModel):
 
     id: str
     delta: dict[str, Any]
-    finish_reason: Optional[str] = Field(None, alias="finishReason")
+    finish_reason: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class EmbeddingRequest(BaseModel):
@@ -131,6 +130,8 @@ class EmbeddingRequest(BaseModel):
     input: str | list[str]
     model: Optional[str] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class Embedding(BaseModel):
     """Single embedding"""
@@ -153,15 +154,14 @@ class CreateAgentInput(BaseModel):
     name: str
     description: Optional[str] = None
     model: str
-    system_prompt: Optional[str] = Field(None, alias="systemPrompt")
+    system_prompt: Optional[str] = None
     temperature: Optional[float] = None
-    max_tokens: Optional[int] = Field(None, alias="maxTokens")
+    max_tokens: Optional[int] = None
     tools: Optional[list[AgentTool]] = None
-    knowledge_base_ids: Optional[list[str]] = Field(None, alias="knowledgeBaseIds")
+    knowledge_base_ids: Optional[list[str]] = None
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 class UpdateAgentInput(BaseModel):
@@ -171,15 +171,14 @@ class UpdateAgentInput(BaseModel):
     description: Optional[str] = None
     status: Optional[AgentStatus] = None
     model: Optional[str] = None
-    system_prompt: Optional[str] = Field(None, alias="systemPrompt")
+    system_prompt: Optional[str] = None
     temperature: Optional[float] = None
-    max_tokens: Optional[int] = Field(None, alias="maxTokens")
+    max_tokens: Optional[int] = None
     tools: Optional[list[AgentTool]] = None
-    knowledge_base_ids: Optional[list[str]] = Field(None, alias="knowledgeBaseIds")
+    knowledge_base_ids: Optional[list[str]] = None
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 class ListAgentsParams(PaginationParams):
@@ -193,35 +192,32 @@ class InvokeAgentInput(BaseModel):
     """Invoke agent input"""
 
     message: str
-    conversation_id: Optional[str] = Field(None, alias="conversationId")
+    conversation_id: Optional[str] = None
     context: Optional[dict[str, Any]] = None
     stream: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 class ToolResult(BaseModel):
     """Tool execution result"""
 
-    tool_call_id: str = Field(alias="toolCallId")
+    tool_call_id: str
     name: str
     result: Any
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class InvokeAgentResponse(BaseModel):
     """Invoke agent response"""
 
     response: str
-    conversation_id: str = Field(alias="conversationId")
-    tool_results: Optional[list[ToolResult]] = Field(None, alias="toolResults")
+    conversation_id: str
+    tool_results: Optional[list[ToolResult]] = None
     usage: TokenUsage
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 __all__ = [
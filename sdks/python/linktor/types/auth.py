@@ -5,7 +5,9 @@ Authentication types
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+from linktor.types.common import CAMEL_CASE_CONFIG, DEFERRED_CONFIG, DEFERRED_CAMEL_CASE_CONFIG
 
 
 class UserRole(str, Enum):
@@ -24,14 +26,13 @@ class User(BaseModel):
     email: str
     name: str
     role: UserRole
-    tenant_id: str = Field(alias="tenantId")
-    avatar_url: Optional[str] = Field(None, alias="avatarUrl")
+    tenant_id: str
+    avatar_url: Optional[str] = None
     phone: Optional[str] = None
-    created_at: datetime = Field(alias="createdAt")
-    updated_at: datetime = Field(alias="updatedAt")
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class LoginRequest(BaseModel):
@@ -40,38 +41,37 @@ class LoginRequest(BaseModel):
     email: str
     password: str
 
+    model_config = DEFERRED_CONFIG
+
 
 class LoginResponse(BaseModel):
     """Login response"""
 
-    access_token: str = Field(alias="accessToken")
-    refresh_token: str = Field(alias="refreshToken")
-    expires_in: int = Field(alias="expiresIn")
-    token_type: str = Field(alias="tokenType")
+    access_token: str
+    refresh_token: str
+    expires_in: int
+    token_type: str
     user: User
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class RefreshTokenRequest(BaseModel):
     """Refresh token request"""
 
-    refresh_token: str = Field(alias="refreshToken")
+    refresh_token: str
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 class RefreshTokenResponse(BaseModel):
     """Refresh token response"""
 
-    access_token: str = Field(alias="accessToken")
-    refresh_token: str = Field(alias="refreshToken")
-    expires_in: int = Field(alias="expiresIn")
+    access_token: str
+    refresh_token: str
+    expires_in: int
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class CreateUserRequest(BaseModel):
@@ -83,16 +83,17 @@ class CreateUserRequest(BaseModel):
     role: UserRole
     phone: Optional[str] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class UpdateUserRequest(BaseModel):
     """Update user request"""
 
     name: Optional[str] = None
     phone: Optional[str] = None
-    avatar_url: Optional[str] = Field(None, alias="avatarUrl")
+    avatar_url: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 __all__ = [
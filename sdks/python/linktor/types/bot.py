@@ -5,9 +5,9 @@ Bot types
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from linktor.types.common import PaginationParams
+from linktor.types.common import CAMEL_CASE_CONFIG, DEFERRED_CAMEL_CASE_CONFIG, PaginationParams
 
 
 class BotStatus(str, Enum):
@@ -31,11 +31,10 @@ class DaySchedule(BaseModel):
 
     day: int  # 0-6 (Sunday-Saturday)
     enabled: bool
-    start_time: str = Field(alias="startTime")
-    end_time: str = Field(alias="endTime")
+    start_time: str
+    end_time: str
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class OperatingHours(BaseModel):
@@ -44,10 +43,9 @@ class OperatingHours(BaseModel):
     enabled: bool
     timezone: str
     schedule: list[DaySchedule]
-    outside_hours_message: Optional[str] = Field(None, alias="outsideHoursMessage")
+    outside_hours_message: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class AIBotConfig(BaseModel):
@@ -55,49 +53,46 @@ class AIBotConfig(BaseModel):
 
     model: str
     temperature: Optional[float] = None
-    max_tokens: Optional[int] = Field(None, alias="maxTokens")
-    system_prompt: Optional[str] = Field(None, alias="systemPrompt")
-    use_knowledge_base: bool = Field(alias="useKnowledgeBase")
-    enable_streaming: Optional[bool] = Field(None, alias="enableStreaming")
+    max_tokens: Optional[int] = None
+    system_prompt: Optional[str] = None
+    use_knowledge_base: bool
+    enable_streaming: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class BotConfig(BaseModel):
     """Bot configuration"""
 
-    welcome_message: Optional[str] = Field(None, alias="welcomeMessage")
-    fallback_message: Optional[str] = Field(None, alias="fallbackMessage")
-    handoff_message: Optional[str] = Field(None, alias="handoffMessage")
-    handoff_triggers: Optional[list[str]] = Field(None, alias="handoffTriggers")
-    operating_hours: Optional[OperatingHours] = Field(None, alias="operatingHours")
-    ai_config: Optional[AIBotConfig] = Field(None, alias="aiConfig")
+    welcome_message: Optional[str] = None
+    fallback_message: Optional[str] = None
+    handoff_message: Optional[str] = None
+    handoff_triggers: Optional[list[str]] = None
+    operating_hours: Optional[OperatingHours] = None
+    ai_config: Optional[AIBotConfig] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class Bot(BaseModel):
     """Bot model"""
 
     id: str
-    tenant_id: str = Field(alias="tenantId")
+    tenant_id: str
     name: str
     description: Optional[str] = None
     status: BotStatus
     type: BotType
     config: BotConfig
-    channel_ids: list[str] = Field(alias="channelIds")
-    flow_id: Optional[str] = Field(None, alias="flowId")
-    agent_id: Optional[str] = Field(None, alias="agentId")
-    knowledge_base_ids: Optional[list[str]] = Field(None, alias="knowledgeBaseIds")
+    channel_ids: list[str]
+    flow_id: Optional[str] = None
+    agent_id: Optional[str] = None
+    knowledge_base_ids: Optional[list[str]] = None
     metadata: Optional[dict[str, Any]] = None
-    created_at: datetime = Field(alias="createdAt")
-    updated_at: datetime = Field(alias="updatedAt")
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 class CreateBotInput(BaseModel):
@@ -107,14 +102,13 @@ class CreateBotInput(BaseModel):
     description: Optional[str] = None
     type: BotType
     config: Optional[dict[str, Any]] = None
-    channel_ids: Optional[list[str]] = Field(None, alias="channelIds")
-    flow_id: Optional[str] = Field(None, alias="flowId")
-    agent_id: Optional[str] = Field(None, alias="agentId")
-    knowledge_base_ids: Optional[list[str]] = Field(None, alias="knowledgeBaseIds")
+    channel_ids: Optional[list[str]] = None
+    flow_id: Optional[str] = None
+    agent_id: Optional[str] = None
+    knowledge_base_ids: Optional[list[str]] = None
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 class UpdateBotInput(BaseModel):
@@ -124,14 +118,13 @@ class UpdateBotInput(BaseModel):
     description: Optional[str] = None
     status: Optional[BotStatus] = None
     config: Optional[dict[str, Any]] = None
-    channel_ids: Optional[list[str]] = Field(None, alias="channelIds")
-    flow_id: Optional[str] = Field(None, alias="flowId")
-    agent_id: Optional[str] = Field(None, alias="agentId")
-    knowledge_base_ids: Optional[list[str]] = Field(None, alias="knowledgeBaseIds")
+    channel_ids: Optional[list[str]] = None
+    flow_id: Optional[str] = None
+    agent_id: Optional[str] = None
+    knowledge_base_ids: Optional[list[str]] = None
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_CAMEL_CASE_CONFIG
 
 
 class ListBotsParams(PaginationParams):
@@ -139,11 +132,10 @@ class ListBotsParams(PaginationParams):
 
     status: Optional[BotStatus] = None
     type: Optional[BotType] = None
-    channel_id: Optional[str] = Field(None, alias="channelId")
+    channel_id: Optional[str] = None
     search: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = CAMEL_CASE_CONFIG
 
 
 __all__ = [
@@ -4,10 +4,16 @@ Channel types
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Literal, Optional, Union
+from pydantic import BaseModel, Discriminator, Field, Tag
 
-from linktor.types.common import ChannelType, PaginationParams
+from linktor.types.common import (
+    POPULATE_BY_NAME_CONFIG,
+    DEFERRED_CONFIG,
+    DEFERRED_POPULATE_BY_NAME_CONFIG,
+    ChannelType,
+    PaginationParams,
+)
 
 
 class ChannelStatus(str, Enum):
@@ -22,107 +28,99 @@ class ChannelStatus(str, Enum):
 class WhatsAppConfig(BaseModel):
     """WhatsApp channel config"""
 
-    type: str = "whatsapp"
+    type: Literal["whatsapp"] = "whatsapp"
     phone_number_id: str = Field(alias="phoneNumberId")
     business_account_id: str = Field(alias="businessAccountId")
     access_token: str = Field(alias="accessToken")
     verify_token: str = Field(alias="verifyToken")
     app_secret: Optional[str] = Field(None, alias="appSecret")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class TelegramConfig(BaseModel):
     """Telegram channel config"""
 
-    type: str = "telegram"
+    type: Literal["telegram"] = "telegram"
     bot_token: str = Field(alias="botToken")
     bot_username: Optional[str] = Field(None, alias="botUsername")
     webhook_secret: Optional[str] = Field(None, alias="webhookSecret")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class FacebookConfig(BaseModel):
     """Facebook channel config"""
 
-    type: str = "facebook"
+    type: Literal["facebook"] = "facebook"
     page_id: str = Field(alias="pageId")
     page_access_token: str = Field(alias="pageAccessToken")
     app_secret: Optional[str] = Field(None, alias="appSecret")
     page_name: Optional[str] = Field(None, alias="pageName")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class InstagramConfig(BaseModel):
     """Instagram channel config"""
 
-    type: str = "instagram"
+    type: Literal["instagram"] = "instagram"
     instagram_id: str = Field(alias="instagramId")
     page_access_token: str = Field(alias="pageAccessToken")
     app_secret: Optional[str] = Field(None, alias="appSecret")
     username: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class WebchatConfig(BaseModel):
     """Webchat channel config"""
 
-    type: str = "webchat"
+    type: Literal["webchat"] = "webchat"
     widget_id: str = Field(alias="widgetId")
     allowed_origins: Optional[list[str]] = Field(None, alias="allowedOrigins")
     theme: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class SMSConfig(BaseModel):
     """SMS channel config"""
 
-    type: str = "sms"
+    type: Literal["sms"] = "sms"
     provider: str = "twilio"
     account_sid: str = Field(alias="accountSid")
     auth_token: str = Field(alias="authToken")
     phone_number: str = Field(alias="phoneNumber")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class EmailConfig(BaseModel):
     """Email channel config"""
 
-    type: str = "email"
+    type: Literal["email"] = "email"
     provider: str  # smtp, sendgrid, mailgun, ses, postmark
     from_email: str = Field(alias="fromEmail")
     from_name: Optional[str] = Field(None, alias="fromName")
     api_key: Optional[str] = Field(None, alias="apiKey")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class RCSConfig(BaseModel):
     """RCS channel config"""
 
-    type: str = "rcs"
+    type: Literal["rcs"] = "rcs"
     provider: str  # zenvia, infobip, pontaltech
     agent_id: str = Field(alias="agentId")
     api_key: str = Field(alias="apiKey")
     brand_name: Optional[str] = Field(None, alias="brandName")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
-ChannelConfig = Union[
+_CHANNEL_CONFIGS = (
     WhatsAppConfig,
     TelegramConfig,
     FacebookConfig,
@@ -131,6 +129,34 @@ ChannelConfig = Union[
     SMSConfig,
     EmailConfig,
     RCSConfig,
+)
+_CHANNEL_CONFIG_TAGS = frozenset(
+    config.model_fields["type"].default for config in _CHANNEL_CONFIGS
+)
+
+
+def _channel_config_tag(value: Any) -> str:
+    """Variant named by ``type``, or ``untagged`` for configs that omit it"""
+    tag = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    return tag if tag in _CHANNEL_CONFIG_TAGS else "untagged"
+
+
+# Tagged on ``type`` so validation picks the variant directly instead of trying each.
+# Configs without a ``type`` still go through the plain union, as they did before it
+# existed; a ``type`` outside the known channels is rejected.
+ChannelConfig = Annotated[
+    Union[
+        Annotated[WhatsAppConfig, Tag("whatsapp")],
+        Annotated[TelegramConfig, Tag("telegram")],
+        Annotated[FacebookConfig, Tag("facebook")],
+        Annotated[InstagramConfig, Tag("instagram")],
+        Annotated[WebchatConfig, Tag("webchat")],
+        Annotated[SMSConfig, Tag("sms")],
+        Annotated[EmailConfig, Tag("email")],
+        Annotated[RCSConfig, Tag("rcs")],
+        Annotated[Union[_CHANNEL_CONFIGS], Tag("untagged")],
+    ],
+    Discriminator(_channel_config_tag),
 ]
 
 
@@ -148,8 +174,7 @@ class Channel(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class CreateChannelInput(BaseModel):
@@ -160,6 +185,8 @@ class CreateChannelInput(BaseModel):
     config: dict[str, Any]
     metadata: Optional[dict[str, Any]] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class UpdateChannelInput(BaseModel):
     """Update channel input"""
@@ -168,6 +195,8 @@ class UpdateChannelInput(BaseModel):
     config: Optional[dict[str, Any]] = None
     metadata: Optional[dict[str, Any]] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class ListChannelsParams(PaginationParams):
     """List channels parameters"""
@@ -189,8 +218,7 @@ class ChannelCapabilities(BaseModel):
     max_message_length: int = Field(alias="maxMessageLength")
     max_media_size: int = Field(alias="maxMediaSize")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 __all__ = [
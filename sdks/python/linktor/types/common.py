@@ -5,11 +5,30 @@ Common types used across the SDK
 from datetime import datetime
 from enum import Enum
 from typing import Any, Generic, TypeVar, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
 
+def to_camel(name: str) -> str:
+    """Convert a snake_case field name to the API's camelCase (``top_k`` -> ``topK``)"""
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+# Shared config for models that declare explicit field aliases
+POPULATE_BY_NAME_CONFIG = ConfigDict(populate_by_name=True)
+
+# Shared config for models whose fields map to camelCase keys in the API
+CAMEL_CASE_CONFIG = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+# Request and params models are built at most once per call; deferring their
+# schema build to first use keeps it out of import time
+DEFERRED_CONFIG = ConfigDict(defer_build=True)
+DEFERRED_POPULATE_BY_NAME_CONFIG = ConfigDict(POPULATE_BY_NAME_CONFIG, defer_build=True)
+DEFERRED_CAMEL_CASE_CONFIG = ConfigDict(CAMEL_CASE_CONFIG, defer_build=True)
+
+
 class PaginationParams(BaseModel):
     """Pagination parameters for list requests"""
 
@@ -17,6 +36,8 @@ class PaginationParams(BaseModel):
     offset: Optional[int] = None
     cursor: Optional[str] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class Pagination(BaseModel):
     """Pagination info in responses"""
@@ -27,8 +48,7 @@ class Pagination(BaseModel):
     has_more: bool = Field(alias="hasMore")
     next_cursor: Optional[str] = Field(None, alias="nextCursor")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -95,8 +115,7 @@ class TimestampsMixin(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 __all__ = [
@@ -6,7 +6,12 @@ from datetime import datetime
 from typing import Any, Optional
 from pydantic import BaseModel, Field
 
-from linktor.types.common import ChannelType, PaginationParams
+from linktor.types.common import (
+    POPULATE_BY_NAME_CONFIG,
+    DEFERRED_POPULATE_BY_NAME_CONFIG,
+    ChannelType,
+    PaginationParams,
+)
 
 
 class ContactIdentifier(BaseModel):
@@ -19,8 +24,7 @@ class ContactIdentifier(BaseModel):
     profile_picture: Optional[str] = Field(None, alias="profilePicture")
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class Contact(BaseModel):
@@ -42,8 +46,7 @@ class Contact(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class CreateContactInput(BaseModel):
@@ -58,8 +61,7 @@ class CreateContactInput(BaseModel):
     tags: Optional[list[str]] = None
     identifiers: Optional[list[dict[str, Any]]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class UpdateContactInput(BaseModel):
@@ -73,8 +75,7 @@ class UpdateContactInput(BaseModel):
     custom_fields: Optional[dict[str, Any]] = Field(None, alias="customFields")
     tags: Optional[list[str]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class ListContactsParams(PaginationParams):
@@ -88,8 +89,7 @@ class ListContactsParams(PaginationParams):
     sort_by: Optional[str] = Field(None, alias="sortBy")
     sort_order: Optional[str] = Field(None, alias="sortOrder")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class MergeContactsInput(BaseModel):
@@ -98,8 +98,7 @@ class MergeContactsInput(BaseModel):
     primary_contact_id: str = Field(alias="primaryContactId")
     secondary_contact_ids: list[str] = Field(alias="secondaryContactIds")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 __all__ = [
@@ -8,6 +8,9 @@ from typing import Any, Optional
 from pydantic import BaseModel, Field
 
 from linktor.types.common import (
+    POPULATE_BY_NAME_CONFIG,
+    DEFERRED_CONFIG,
+    DEFERRED_POPULATE_BY_NAME_CONFIG,
     ChannelType,
     ContentType,
     MessageDirection,
@@ -44,8 +47,7 @@ class MediaContent(BaseModel):
     caption: Optional[str] = None
     thumbnail_url: Optional[str] = Field(None, alias="thumbnailUrl")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class LocationContent(BaseModel):
@@ -124,8 +126,7 @@ class MessageContent(BaseModel):
     list_sections: Optional[list[ListSection]] = Field(None, alias="listSections")
     template: Optional[TemplateContent] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class Message(BaseModel):
@@ -147,8 +148,7 @@ class Message(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class Conversation(BaseModel):
@@ -170,8 +170,7 @@ class Conversation(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class ListConversationsParams(PaginationParams):
@@ -187,8 +186,7 @@ class ListConversationsParams(PaginationParams):
     sort_by: Optional[str] = Field(None, alias="sortBy")
     sort_order: Optional[str] = Field(None, alias="sortOrder")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class SendMessageInput(BaseModel):
@@ -201,6 +199,8 @@ class SendMessageInput(BaseModel):
     template: Optional[TemplateContent] = None
     metadata: Optional[dict[str, Any]] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class UpdateConversationInput(BaseModel):
     """Update conversation input"""
@@ -210,8 +210,7 @@ class UpdateConversationInput(BaseModel):
     tags: Optional[list[str]] = None
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class ListMessagesParams(PaginationParams):
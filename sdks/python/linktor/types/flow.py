@@ -7,7 +7,12 @@ from enum import Enum
 from typing import Any, Optional
 from pydantic import BaseModel, Field
 
-from linktor.types.common import PaginationParams
+from linktor.types.common import (
+    POPULATE_BY_NAME_CONFIG,
+    DEFERRED_CONFIG,
+    DEFERRED_POPULATE_BY_NAME_CONFIG,
+    PaginationParams,
+)
 
 
 class FlowStatus(str, Enum):
@@ -72,8 +77,7 @@ class FlowNodeData(BaseModel):
     delay_seconds: Optional[int] = Field(None, alias="delaySeconds")
     assignments: Optional[list[dict[str, Any]]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class FlowNode(BaseModel):
@@ -96,8 +100,7 @@ class FlowEdge(BaseModel):
     label: Optional[str] = None
     condition: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class FlowVariable(BaseModel):
@@ -108,8 +111,7 @@ class FlowVariable(BaseModel):
     default_value: Optional[Any] = Field(None, alias="defaultValue")
     description: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class Flow(BaseModel):
@@ -128,8 +130,7 @@ class Flow(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class FlowExecutionStep(BaseModel):
@@ -143,8 +144,7 @@ class FlowExecutionStep(BaseModel):
     output: Optional[dict[str, Any]] = None
     error: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class FlowExecution(BaseModel):
@@ -161,8 +161,7 @@ class FlowExecution(BaseModel):
     completed_at: Optional[datetime] = Field(None, alias="completedAt")
     error: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class CreateFlowInput(BaseModel):
@@ -175,6 +174,8 @@ class CreateFlowInput(BaseModel):
     variables: Optional[list[FlowVariable]] = None
     metadata: Optional[dict[str, Any]] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class UpdateFlowInput(BaseModel):
     """Update flow input"""
@@ -187,6 +188,8 @@ class UpdateFlowInput(BaseModel):
     variables: Optional[list[FlowVariable]] = None
     metadata: Optional[dict[str, Any]] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class ListFlowsParams(PaginationParams):
     """List flows parameters"""
@@ -202,8 +205,7 @@ class ExecuteFlowInput(BaseModel):
     variables: Optional[dict[str, Any]] = None
     start_node_id: Optional[str] = Field(None, alias="startNodeId")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 __all__ = [
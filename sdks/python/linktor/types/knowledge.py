@@ -7,7 +7,12 @@ from enum import Enum
 from typing import Any, Optional
 from pydantic import BaseModel, Field
 
-from linktor.types.common import PaginationParams
+from linktor.types.common import (
+    POPULATE_BY_NAME_CONFIG,
+    DEFERRED_CONFIG,
+    DEFERRED_POPULATE_BY_NAME_CONFIG,
+    PaginationParams,
+)
 
 
 class KnowledgeBaseStatus(str, Enum):
@@ -57,8 +62,7 @@ class KnowledgeBase(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class Document(BaseModel):
@@ -77,8 +81,7 @@ class Document(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class DocumentChunk(BaseModel):
@@ -91,8 +94,7 @@ class DocumentChunk(BaseModel):
     token_count: int = Field(alias="tokenCount")
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class ScoredChunk(DocumentChunk):
@@ -110,8 +112,7 @@ class QueryKnowledgeBaseInput(BaseModel):
     threshold: Optional[float] = None
     filter: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class QueryResult(BaseModel):
@@ -132,8 +133,7 @@ class CreateKnowledgeBaseInput(BaseModel):
     chunk_overlap: Optional[int] = Field(None, alias="chunkOverlap")
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class UpdateKnowledgeBaseInput(BaseModel):
@@ -143,6 +143,8 @@ class UpdateKnowledgeBaseInput(BaseModel):
     description: Optional[str] = None
     metadata: Optional[dict[str, Any]] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class ListKnowledgeBasesParams(PaginationParams):
     """List knowledge bases parameters"""
@@ -160,8 +162,7 @@ class UploadDocumentInput(BaseModel):
     source_url: Optional[str] = Field(None, alias="sourceUrl")
     metadata: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class ListDocumentsParams(PaginationParams):
@@ -6,6 +6,12 @@ from enum import Enum
 from typing import Any, Optional
 from pydantic import BaseModel, Field
 
+from linktor.types.common import (
+    POPULATE_BY_NAME_CONFIG,
+    DEFERRED_CONFIG,
+    DEFERRED_POPULATE_BY_NAME_CONFIG,
+)
+
 
 class VREOutputFormat(str, Enum):
     """Output format for rendered images"""
@@ -70,8 +76,7 @@ class VRERenderRequest(BaseModel):
     quality: Optional[int] = None
     scale: Optional[float] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class VRERenderResponse(BaseModel):
@@ -86,8 +91,7 @@ class VRERenderResponse(BaseModel):
     size_bytes: Optional[int] = Field(None, alias="sizeBytes")
     cache_hit: Optional[bool] = Field(None, alias="cacheHit")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 # ============================================
@@ -104,8 +108,7 @@ class VRERenderAndSendRequest(BaseModel):
     caption: Optional[str] = None
     follow_up_text: Optional[str] = Field(None, alias="followUpText")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class VRERenderAndSendResponse(BaseModel):
@@ -115,8 +118,7 @@ class VRERenderAndSendResponse(BaseModel):
     image_url: str = Field(alias="imageUrl")
     caption: str
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 # ============================================
@@ -145,8 +147,7 @@ class VREPreviewRequest(BaseModel):
     template_id: VRETemplateType = Field(alias="templateId")
     data: Optional[dict[str, Any]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class VREPreviewResponse(BaseModel):
@@ -156,8 +157,7 @@ class VREPreviewResponse(BaseModel):
     width: int
     height: int
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 # ============================================
@@ -172,6 +172,8 @@ class MenuOpcaoData(BaseModel):
     descricao: Optional[str] = None
     icone: Optional[str] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class MenuOpcoesData(BaseModel):
     """Data for menu_opcoes template"""
@@ -181,8 +183,7 @@ class MenuOpcoesData(BaseModel):
     opcoes: list[MenuOpcaoData]
     mensagem_antes: Optional[str] = Field(None, alias="mensagemAntes")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class CardProdutoData(BaseModel):
@@ -197,8 +198,7 @@ class CardProdutoData(BaseModel):
     destaque: Optional[str] = None
     mensagem: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class StatusPedidoStep(BaseModel):
@@ -208,6 +208,8 @@ class StatusPedidoStep(BaseModel):
     icon: str
     label: str
 
+    model_config = DEFERRED_CONFIG
+
 
 class StatusPedidoData(BaseModel):
     """Data for status_pedido template"""
@@ -220,8 +222,7 @@ class StatusPedidoData(BaseModel):
     motorista: Optional[str] = None
     mensagem: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class ListaProdutoItem(BaseModel):
@@ -234,8 +235,7 @@ class ListaProdutoItem(BaseModel):
     sku: Optional[str] = None
     emoji: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class ListaProdutosData(BaseModel):
@@ -245,6 +245,8 @@ class ListaProdutosData(BaseModel):
     produtos: list[ListaProdutoItem]
     mensagem: Optional[str] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class ConfirmacaoItem(BaseModel):
     """Confirmation item for confirmacao template"""
@@ -254,6 +256,8 @@ class ConfirmacaoItem(BaseModel):
     preco: float
     emoji: Optional[str] = None
 
+    model_config = DEFERRED_CONFIG
+
 
 class ConfirmacaoData(BaseModel):
     """Data for confirmacao template"""
@@ -265,8 +269,7 @@ class ConfirmacaoData(BaseModel):
     previsao_entrega: Optional[str] = Field(None, alias="previsaoEntrega")
     mensagem: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class CobrancaPixData(BaseModel):
@@ -278,8 +281,7 @@ class CobrancaPixData(BaseModel):
     expiracao: Optional[str] = None
     mensagem: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 __all__ = [
@@ -7,7 +7,13 @@ from enum import Enum
 from typing import Any, Generic, Optional, TypeVar
 from pydantic import BaseModel, Field
 
-from linktor.types.common import ChannelType, MessageDirection, MessageStatus
+from linktor.types.common import (
+    POPULATE_BY_NAME_CONFIG,
+    DEFERRED_POPULATE_BY_NAME_CONFIG,
+    ChannelType,
+    MessageDirection,
+    MessageStatus,
+)
 
 
 class WebhookEventType(str, Enum):
@@ -41,8 +47,7 @@ class WebhookEvent(BaseModel, Generic[T]):
     tenant_id: str = Field(alias="tenantId")
     data: T
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class MessageReceivedEventData(BaseModel):
@@ -54,8 +59,7 @@ class MessageReceivedEventData(BaseModel):
     channel_id: str = Field(alias="channelId")
     channel_type: ChannelType = Field(alias="channelType")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class MessageStatusEventData(BaseModel):
@@ -68,8 +72,7 @@ class MessageStatusEventData(BaseModel):
     timestamp: datetime
     error: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class ConversationEventData(BaseModel):
@@ -83,8 +86,7 @@ class ConversationEventData(BaseModel):
     previous_status: Optional[str] = Field(None, alias="previousStatus")
     previous_assigned_to: Optional[str] = Field(None, alias="previousAssignedTo")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class ContactEventData(BaseModel):
@@ -96,8 +98,7 @@ class ContactEventData(BaseModel):
     phone: Optional[str] = None
     previous_data: Optional[dict[str, Any]] = Field(None, alias="previousData")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class ChannelEventData(BaseModel):
@@ -108,8 +109,7 @@ class ChannelEventData(BaseModel):
     status: str
     error: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class RetryPolicy(BaseModel):
@@ -119,8 +119,7 @@ class RetryPolicy(BaseModel):
     retry_interval: int = Field(alias="retryInterval")  # seconds
     exponential_backoff: bool = Field(alias="exponentialBackoff")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class WebhookConfig(BaseModel):
@@ -137,8 +136,7 @@ class WebhookConfig(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 class CreateWebhookInput(BaseModel):
@@ -149,8 +147,7 @@ class CreateWebhookInput(BaseModel):
     headers: Optional[dict[str, str]] = None
     retry_policy: Optional[RetryPolicy] = Field(None, alias="retryPolicy")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class UpdateWebhookInput(BaseModel):
@@ -162,8 +159,7 @@ class UpdateWebhookInput(BaseModel):
     headers: Optional[dict[str, str]] = None
     retry_policy: Optional[RetryPolicy] = Field(None, alias="retryPolicy")
 
-    class Config:
-        populate_by_name = True
+    model_config = DEFERRED_POPULATE_BY_NAME_CONFIG
 
 
 class WebhookDelivery(BaseModel):
@@ -181,8 +177,7 @@ class WebhookDelivery(BaseModel):
     error: Optional[str] = None
     created_at: datetime = Field(alias="createdAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = POPULATE_BY_NAME_CONFIG
 
 
 __all__ = [
@@ -0,0 +1,123 @@
+"""
+Response caching for idempotent requests
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def make_cache_key(path: str, params: Optional[dict[str, Any]] = None) -> CacheKey:
+    """Build a hashable cache key from a request path and query params"""
+    if not params:
+        return (path, ())
+    return (path, tuple(sorted((key, repr(value)) for key, value in params.items())))
+
+
+def resource_prefix(path: str) -> str:
+    """Return the top-level resource of a path (``/contacts/1`` -> ``/contacts``)"""
+    return "/" + path.lstrip("/").split("/", 1)[0]
+
+
+class ResponseCache(Generic[T]):
+    """
+    Bounded TTL cache that coalesces concurrent fetches
+
+    When several threads ask for the same missing key, only the first one
+    performs the fetch; the others wait for its result instead of issuing
+    duplicate requests. Expired entries are kept until evicted so they can be
+    served as a fallback when a refetch fails.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, tuple[float, T]] = OrderedDict()
+        self._inflight: dict[CacheKey, Future[T]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], T],
+        max_age: Optional[float] = None,
+        stale_if: Optional[Callable[[BaseException], bool]] = None,
+    ) -> T:
+        """
+        Return the cached value for ``key``, fetching it if missing or expired
+
+        Args:
+            key: Cache key
+            fetch: Function producing a fresh value
+            max_age: Cap on the cache TTL for this lookup
+            stale_if: Predicate on a fetch error; when it returns True and an
+                expired value exists, that value is returned instead of raising
+        """
+        ttl = self.ttl if max_age is None else min(self.ttl, max_age)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            future = self._inflight.get(key)
+            if future is not None:
+                owner = False
+            else:
+                owner = True
+                future = self._inflight[key] = Future()
+                generation = self._generation
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+                stale = self._entries.get(key)
+            if stale is not None and stale_if is not None and stale_if(e):
+                future.set_result(stale[1])
+                return stale[1]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            # Skip storing results that raced with an invalidation
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every entry whose path is ``prefix`` or below it"""
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key in self._entries
+                if key[0] == prefix or key[0].startswith(prefix + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+__all__ = ["ResponseCache", "make_cache_key", "resource_prefix"]
@@ -155,11 +155,12 @@ def create_error_from_response(
         return LinktorError(message, code or "UNKNOWN_ERROR", status, request_id, details)
 
 
+_RETRYABLE_ERRORS = (RateLimitError, ServerError, NetworkError, TimeoutError)
+
+
 def is_retryable_error(error: Exception) -> bool:
     """Check if error is retryable"""
-    if isinstance(error, (RateLimitError, ServerError, NetworkError, TimeoutError)):
-        return True
-    return False
+    return isinstance(error, _RETRYABLE_ERRORS)
 
 
 __all__ = [
@@ -3,48 +3,250 @@ HTTP client utility
 """
 
 import asyncio
-from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+import contextvars
+import inspect
+import os
+import random
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import httpx
 
 from linktor.utils.errors import (
+    AuthenticationError,
     LinktorError,
     NetworkError,
+    RateLimitError,
     TimeoutError,
     create_error_from_response,
     is_retryable_error,
 )
+from linktor.utils.cache import ResponseCache, make_cache_key, resource_prefix
+from linktor.utils.serialization import JSONDecodeError, dumps, loads
 
 T = TypeVar("T")
 
+FileInput = Union[bytes, IO[bytes], str, "os.PathLike[str]"]
 
-class HttpClient:
-    """Synchronous HTTP client"""
+# Connections are kept alive and shared by every request made through a client,
+# so only the first call to a host pays the TCP/TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
 
-    def __init__(
-        self,
-        base_url: str,
-        api_key: Optional[str] = None,
-        access_token: Optional[str] = None,
-        timeout: float = 30.0,
-        max_retries: int = 3,
-        retry_delay: float = 1.0,
-        headers: Optional[dict[str, str]] = None,
-        on_token_refresh: Optional[Callable[[], str]] = None,
+
+def pool_limits(max_connections: Optional[int], max_keepalive: Optional[int]) -> httpx.Limits:
+    """Build connection pool limits, keeping the default keep-alive expiry"""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=DEFAULT_LIMITS.keepalive_expiry,
+    )
+
+
+def _require_h2() -> None:
+    """Fail with an install hint instead of httpx's bare ImportError"""
+    try:
+        import h2  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "HTTP/2 requires the 'http2' extra: pip install linktor[http2]"
+        ) from e
+
+
+# Upper bound on a single backoff sleep between retries, in seconds
+MAX_RETRY_DELAY = 30.0
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[int]:
+    """Parse a delta-seconds ``Retry-After`` header, ignoring HTTP dates"""
+    if value is None:
+        return None
+    value = value.strip()
+    # isdigit() alone also accepts non-ASCII digits such as "²", which int() rejects
+    if not (value.isascii() and value.isdigit()):
+        return None
+    return int(value)
+
+
+def _backoff(error: Exception, base: float, previous: float) -> float:
+    """
+    Seconds to wait before retrying after ``error``
+
+    Honours the server's Retry-After on rate limits; otherwise uses decorrelated
+    jitter so clients that failed together do not retry in lockstep.
+    """
+    retry_after = error.retry_after if isinstance(error, RateLimitError) else None
+    # May come from the JSON body, so only a positive number is trusted
+    if (
+        isinstance(retry_after, (int, float))
+        and not isinstance(retry_after, bool)
+        and retry_after > 0
     ):
-        self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self.access_token = access_token
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-        self.custom_headers = headers or {}
-        self.on_token_refresh = on_token_refresh
+        return min(MAX_RETRY_DELAY, float(retry_after))
+    return min(MAX_RETRY_DELAY, random.uniform(base, previous * 3))
 
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            headers=self._build_headers(),
+
+# A 401 from these means bad credentials, not an expired token, so never refresh
+_NO_REFRESH_PATHS = frozenset({"/auth/login", "/auth/refresh"})
+
+
+def _encode_body(data: Optional[dict[str, Any]]) -> Optional[bytes]:
+    return None if data is None else dumps(data)
+
+
+@contextmanager
+def _open_upload(file: FileInput) -> Iterator[Union[bytes, IO[bytes]]]:
+    """
+    Yield upload content for ``file``
+
+    Paths are opened here and closed afterwards. File objects are passed
+    through as-is so httpx reads them in chunks instead of loading them whole.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            yield f
+    else:
+        yield file
+
+
+def _multipart_headers() -> dict[str, str]:
+    # Overrides the client's JSON Content-Type; httpx reads the boundary from it
+    return {"Content-Type": f"multipart/form-data; boundary={secrets.token_hex(16)}"}
+
+
+def _is_transient(error: BaseException) -> bool:
+    return isinstance(error, Exception) and is_retryable_error(error)
+
+
+def _parse_sse_line(line: str) -> Optional[Any]:
+    """Decode the JSON payload of an SSE ``data:`` line, if it carries one"""
+    if line.startswith("data: "):
+        json_str = line[6:].strip()
+        if json_str and json_str != "[DONE]":
+            try:
+                return loads(json_str)
+            except JSONDecodeError:
+                pass
+    return None
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Transport view that leaves closing to SharedConnectionPool"""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+# base URL, max connections, max keep-alive, keep-alive expiry, HTTP/2
+_PoolKey = tuple[str, Optional[int], Optional[int], Optional[float], bool]
+
+
+class SharedConnectionPool:
+    """
+    Process-wide registry of connection pools, keyed by base URL and settings
+
+    Clients created with ``share_pool=True`` reuse one pool per host, so
+    short-lived clients (e.g. one per web request) skip pool creation and the
+    first TCP/TLS handshake. Clients asking for different limits or HTTP/2 get
+    their own pool. A pool is closed when its last client releases it.
+    """
+
+    _lock = threading.Lock()
+    _transports: dict[_PoolKey, httpx.HTTPTransport] = {}
+    _refcounts: dict[_PoolKey, int] = {}
+
+    @staticmethod
+    def _key(
+        base_url: str,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+    ) -> _PoolKey:
+        """Registry key for a pool (``httpx.Limits`` itself is unhashable)"""
+        return (
+            base_url,
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+            http2,
+        )
+
+    @classmethod
+    def acquire(
+        cls,
+        base_url: str,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+    ) -> httpx.BaseTransport:
+        """Get the shared transport for ``base_url``, creating it if needed"""
+        key = cls._key(base_url, limits, http2)
+        with cls._lock:
+            transport = cls._transports.get(key)
+            if transport is None:
+                transport = cls._transports[key] = httpx.HTTPTransport(
+                    limits=limits, http2=http2
+                )
+            cls._refcounts[key] = cls._refcounts.get(key, 0) + 1
+            return _SharedTransport(transport)
+
+    @classmethod
+    def release(
+        cls,
+        base_url: str,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+    ) -> None:
+        """Release one reference, closing the pool once it is unused"""
+        key = cls._key(base_url, limits, http2)
+        with cls._lock:
+            count = cls._refcounts.get(key, 0) - 1
+            if count > 0:
+                cls._refcounts[key] = count
+                return
+            cls._refcounts.pop(key, None)
+            transport = cls._transports.pop(key, None)
+        if transport is not None:
+            transport.close()
+
+
+class _BaseHttpClient:
+    """Header, credential and response handling shared by both clients"""
+
+    api_key: Optional[str]
+    access_token: Optional[str]
+    custom_headers: dict[str, str]
+    on_token_refresh: Optional[Callable[[], Any]]
+    _client: Union[httpx.Client, httpx.AsyncClient]
+    # Set in the thread/task running on_token_refresh, which may call back into
+    # this client; those calls must not wait on the refresh lock they hold
+    _refreshing: "contextvars.ContextVar[bool]"
+
+    def _can_refresh(self, path: str) -> bool:
+        return (
+            self.on_token_refresh is not None
+            and path not in _NO_REFRESH_PATHS
+            and not self._refreshing.get()
         )
 
     def _build_headers(self) -> dict[str, str]:
@@ -59,33 +261,143 @@ class HttpClient:
             headers["Authorization"] = f"Bearer {self.access_token}"
         return headers
 
-    def _handle_response(self, response: httpx.Response) -> Any:
+    def _check_response(self, response: httpx.Response) -> httpx.Response:
         request_id = response.headers.get("x-request-id")
 
         if response.status_code >= 400:
             try:
-                body = response.json()
+                body = loads(response.content)
             except Exception:
                 body = {"message": response.text}
+            if not isinstance(body, dict):
+                body = {"message": response.text}
+            if response.status_code == 429 and "retry_after" not in body:
+                body["retry_after"] = _retry_after_seconds(response.headers.get("retry-after"))
             raise create_error_from_response(response.status_code, body, request_id)
 
+        return response
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
         if response.status_code == 204:
             return None
 
-        return response.json()
+        return loads(response.content)
+
+    def _credentials_changed(self) -> None:
+        """Hook run after the API key or access token changes"""
+
+    def set_access_token(self, token: str) -> None:
+        if token == self.access_token:
+            return
+        self.access_token = token
+        self._client.headers["Authorization"] = f"Bearer {token}"
+        self._credentials_changed()
+
+    def set_api_key(self, api_key: str) -> None:
+        if api_key == self.api_key:
+            return
+        self.api_key = api_key
+        self._client.headers["X-API-Key"] = api_key
+        self._credentials_changed()
+
+
+class HttpClient(_BaseHttpClient):
+    """Synchronous HTTP client"""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        headers: Optional[dict[str, str]] = None,
+        on_token_refresh: Optional[Callable[[], str]] = None,
+        limits: Optional[httpx.Limits] = None,
+        share_pool: bool = False,
+        cache_ttl: float = 0.0,
+        cache_stale_on_error: bool = False,
+        http2: bool = False,
+    ):
+        if http2:
+            _require_h2()
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.access_token = access_token
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.custom_headers = headers or {}
+        self.on_token_refresh = on_token_refresh
+        self.share_pool = share_pool
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = http2
+        self._refresh_lock = threading.Lock()
+        self._refreshing = contextvars.ContextVar("linktor_refreshing", default=False)
+        self._cache: Optional[ResponseCache[httpx.Response]] = (
+            ResponseCache(cache_ttl) if cache_ttl > 0 else None
+        )
+        self.cache_stale_on_error = cache_stale_on_error
+
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=self._build_headers(),
+            limits=self.limits,
+            http2=http2,
+            # A shared transport is looked up by the same limits and http2 flag
+            transport=(
+                SharedConnectionPool.acquire(self.base_url, self.limits, http2)
+                if share_pool
+                else None
+            ),
+        )
+
+    def _refresh_token(self, rejected_token: Optional[str]) -> None:
+        """Refresh the access token unless another thread already replaced it"""
+        assert self.on_token_refresh is not None
+        with self._refresh_lock:
+            if self.access_token == rejected_token:
+                reset = self._refreshing.set(True)
+                try:
+                    token = self.on_token_refresh()
+                finally:
+                    self._refreshing.reset(reset)
+                self.set_access_token(token)
 
     def _request_with_retry(
         self,
         method: str,
         path: str,
         **kwargs: Any,
-    ) -> Any:
+    ) -> httpx.Response:
+        token = self.access_token
+        try:
+            return self._send_with_retry(method, path, **kwargs)
+        except AuthenticationError:
+            if not self._can_refresh(path):
+                raise
+        # Concurrent 401s share one refresh; the rest wait on the lock
+        self._refresh_token(token)
+        return self._send_with_retry(method, path, **kwargs)
+
+    def _send_with_retry(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
         last_error: Optional[Exception] = None
+        delay = self.retry_delay
+        # Built once so retries resend the same URL, headers and encoded body
+        request = self._client.build_request(method, path, **kwargs)
 
         for attempt in range(self.max_retries + 1):
             try:
-                response = self._client.request(method, path, **kwargs)
-                return self._handle_response(response)
+                response = self._client.send(request)
+                return self._check_response(response)
             except httpx.TimeoutException:
                 last_error = TimeoutError("Request timeout")
             except httpx.NetworkError as e:
@@ -96,61 +408,138 @@ class HttpClient:
                     raise
 
             if attempt < self.max_retries:
-                import time
-
-                delay = self.retry_delay * (2**attempt)
+                delay = _backoff(last_error, self.retry_delay, delay)
                 time.sleep(delay)
 
-        if last_error:
-            raise last_error
+        assert last_error is not None
+        raise last_error
+
+    def _write(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        response = self._request_with_retry(method, path, **kwargs)
+        if self._cache is not None:
+            self._cache.invalidate(resource_prefix(path))
+        return response
 
-    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        return self._request_with_retry("GET", path, params=params)
+    def _get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]],
+        max_age: Optional[float] = None,
+    ) -> httpx.Response:
+        if self._cache is None or max_age == 0:
+            return self._request_with_retry("GET", path, params=params)
+
+        return self._cache.get_or_fetch(
+            make_cache_key(path, params),
+            lambda: self._request_with_retry("GET", path, params=params),
+            max_age=max_age,
+            stale_if=_is_transient if self.cache_stale_on_error else None,
+        )
+
+    def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        max_age: Optional[float] = None,
+    ) -> Any:
+        return self._decode(self._get(path, params, max_age))
 
     def post(
         self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
     ) -> Any:
-        return self._request_with_retry("POST", path, json=data, **kwargs)
+        return self._decode(self._write("POST", path, content=_encode_body(data), **kwargs))
 
     def put(
         self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
     ) -> Any:
-        return self._request_with_retry("PUT", path, json=data, **kwargs)
+        return self._decode(self._write("PUT", path, content=_encode_body(data), **kwargs))
 
     def patch(
         self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
     ) -> Any:
-        return self._request_with_retry("PATCH", path, json=data, **kwargs)
+        return self._decode(self._write("PATCH", path, content=_encode_body(data), **kwargs))
 
     def delete(self, path: str, **kwargs: Any) -> Any:
-        return self._request_with_retry("DELETE", path, **kwargs)
+        return self._decode(self._write("DELETE", path, **kwargs))
+
+    # Raw variants return the undecoded body so callers can validate it
+    # straight into a model with ``Model.model_validate_json``
 
-    def upload(
+    def get_raw(
         self,
         path: str,
-        file: bytes,
+        params: Optional[dict[str, Any]] = None,
+        max_age: Optional[float] = None,
+    ) -> bytes:
+        return self._get(path, params, max_age).content
+
+    def post_raw(
+        self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> bytes:
+        return self._write("POST", path, content=_encode_body(data), **kwargs).content
+
+    def patch_raw(
+        self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> bytes:
+        return self._write("PATCH", path, content=_encode_body(data), **kwargs).content
+
+    def _upload(
+        self,
+        path: str,
+        file: FileInput,
         filename: str,
         field_name: str = "file",
         additional_data: Optional[dict[str, str]] = None,
-    ) -> Any:
-        files = {field_name: (filename, file)}
-        data = additional_data or {}
-        return self._request_with_retry("POST", path, files=files, data=data)
-
-    def set_access_token(self, token: str) -> None:
-        self.access_token = token
-        self._client.headers["Authorization"] = f"Bearer {token}"
-
-    def set_api_key(self, api_key: str) -> None:
-        self.api_key = api_key
-        self._client.headers["X-API-Key"] = api_key
+    ) -> httpx.Response:
+        with _open_upload(file) as content:
+            return self._write(
+                "POST",
+                path,
+                files={field_name: (filename, content)},
+                data=additional_data or {},
+                headers=_multipart_headers(),
+            )
+
+    def upload(self, path: str, file: FileInput, filename: str, **kwargs: Any) -> Any:
+        return self._decode(self._upload(path, file, filename, **kwargs))
+
+    def upload_raw(self, path: str, file: FileInput, filename: str, **kwargs: Any) -> bytes:
+        return self._upload(path, file, filename, **kwargs).content
+
+    def stream(
+        self, path: str, data: Optional[dict[str, Any]] = None
+    ) -> Iterator[dict[str, Any]]:
+        with self._client.stream(
+            "POST", path, content=_encode_body(data)
+        ) as response:
+            if response.status_code >= 400:
+                response.read()
+                self._check_response(response)
+            for line in response.iter_lines():
+                event = _parse_sse_line(line)
+                if event is not None:
+                    yield event
+
+    def _credentials_changed(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
 
     def close(self) -> None:
+        if self._client.is_closed:
+            return
         self._client.close()
+        if self.share_pool:
+            SharedConnectionPool.release(self.base_url, self.limits, self.http2)
+
 
+class AsyncHttpClient(_BaseHttpClient):
+    """
+    Asynchronous HTTP client
 
-class AsyncHttpClient:
-    """Asynchronous HTTP client"""
+    Every request goes through the single ``httpx.AsyncClient`` created here,
+    so concurrent calls share one connection pool. It is only closed by
+    ``close()``; never open a client per request.
+    """
 
     def __init__(
         self,
@@ -161,8 +550,12 @@ class AsyncHttpClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         headers: Optional[dict[str, str]] = None,
-        on_token_refresh: Optional[Callable[[], str]] = None,
+        on_token_refresh: Optional[Callable[[], Union[str, Awaitable[str]]]] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
     ):
+        if http2:
+            _require_h2()
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.access_token = access_token
@@ -171,52 +564,65 @@ class AsyncHttpClient:
         self.retry_delay = retry_delay
         self.custom_headers = headers or {}
         self.on_token_refresh = on_token_refresh
+        # Created lazily so it binds to the running event loop
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._refreshing = contextvars.ContextVar("linktor_refreshing", default=False)
 
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
             headers=self._build_headers(),
+            limits=limits or DEFAULT_LIMITS,
+            http2=http2,
         )
 
-    def _build_headers(self) -> dict[str, str]:
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **self.custom_headers,
-        }
-        if self.api_key:
-            headers["X-API-Key"] = self.api_key
-        elif self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-        return headers
-
-    def _handle_response(self, response: httpx.Response) -> Any:
-        request_id = response.headers.get("x-request-id")
-
-        if response.status_code >= 400:
-            try:
-                body = response.json()
-            except Exception:
-                body = {"message": response.text}
-            raise create_error_from_response(response.status_code, body, request_id)
-
-        if response.status_code == 204:
-            return None
-
-        return response.json()
+    async def _refresh_token(self, rejected_token: Optional[str]) -> None:
+        """Refresh the access token unless another task already replaced it"""
+        assert self.on_token_refresh is not None
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if self.access_token == rejected_token:
+                reset = self._refreshing.set(True)
+                try:
+                    token = self.on_token_refresh()
+                    if inspect.isawaitable(token):
+                        token = await token
+                finally:
+                    self._refreshing.reset(reset)
+                self.set_access_token(token)
 
     async def _request_with_retry(
         self,
         method: str,
         path: str,
         **kwargs: Any,
-    ) -> Any:
+    ) -> httpx.Response:
+        token = self.access_token
+        try:
+            return await self._send_with_retry(method, path, **kwargs)
+        except AuthenticationError:
+            if not self._can_refresh(path):
+                raise
+        # Concurrent 401s share one refresh; the rest wait on the lock
+        await self._refresh_token(token)
+        return await self._send_with_retry(method, path, **kwargs)
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
         last_error: Optional[Exception] = None
+        delay = self.retry_delay
+        # Built once so retries resend the same URL, headers and encoded body
+        request = self._client.build_request(method, path, **kwargs)
 
         for attempt in range(self.max_retries + 1):
             try:
-                response = await self._client.request(method, path, **kwargs)
-                return self._handle_response(response)
+                response = await self._client.send(request)
+                return self._check_response(response)
             except httpx.TimeoutException:
                 last_error = TimeoutError("Request timeout")
             except httpx.NetworkError as e:
@@ -227,70 +633,116 @@ class AsyncHttpClient:
                     raise
 
             if attempt < self.max_retries:
-                delay = self.retry_delay * (2**attempt)
+                delay = _backoff(last_error, self.retry_delay, delay)
                 await asyncio.sleep(delay)
 
-        if last_error:
-            raise last_error
+        assert last_error is not None
+        raise last_error
 
     async def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        return await self._request_with_retry("GET", path, params=params)
+        return self._decode(await self._request_with_retry("GET", path, params=params))
 
     async def post(
         self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
     ) -> Any:
-        return await self._request_with_retry("POST", path, json=data, **kwargs)
+        response = await self._request_with_retry(
+            "POST", path, content=_encode_body(data), **kwargs
+        )
+        return self._decode(response)
 
     async def put(
         self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
     ) -> Any:
-        return await self._request_with_retry("PUT", path, json=data, **kwargs)
+        response = await self._request_with_retry(
+            "PUT", path, content=_encode_body(data), **kwargs
+        )
+        return self._decode(response)
 
     async def patch(
         self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
     ) -> Any:
-        return await self._request_with_retry("PATCH", path, json=data, **kwargs)
+        response = await self._request_with_retry(
+            "PATCH", path, content=_encode_body(data), **kwargs
+        )
+        return self._decode(response)
 
     async def delete(self, path: str, **kwargs: Any) -> Any:
-        return await self._request_with_retry("DELETE", path, **kwargs)
+        return self._decode(await self._request_with_retry("DELETE", path, **kwargs))
+
+    # Raw variants return the undecoded body so callers can validate it
+    # straight into a model with ``Model.model_validate_json``
+
+    async def get_raw(self, path: str, params: Optional[dict[str, Any]] = None) -> bytes:
+        response = await self._request_with_retry("GET", path, params=params)
+        return response.content
+
+    async def post_raw(
+        self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> bytes:
+        response = await self._request_with_retry(
+            "POST", path, content=_encode_body(data), **kwargs
+        )
+        return response.content
+
+    async def patch_raw(
+        self, path: str, data: Optional[dict[str, Any]] = None, **kwargs: Any
+    ) -> bytes:
+        response = await self._request_with_retry(
+            "PATCH", path, content=_encode_body(data), **kwargs
+        )
+        return response.content
 
-    async def upload(
+    async def _upload(
         self,
         path: str,
-        file: bytes,
+        file: FileInput,
         filename: str,
         field_name: str = "file",
         additional_data: Optional[dict[str, str]] = None,
-    ) -> Any:
-        files = {field_name: (filename, file)}
-        data = additional_data or {}
-        return await self._request_with_retry("POST", path, files=files, data=data)
+    ) -> httpx.Response:
+        with _open_upload(file) as content:
+            return await self._request_with_retry(
+                "POST",
+                path,
+                files={field_name: (filename, content)},
+                data=additional_data or {},
+                headers=_multipart_headers(),
+            )
+
+    async def upload(self, path: str, file: FileInput, filename: str, **kwargs: Any) -> Any:
+        return self._decode(await self._upload(path, file, filename, **kwargs))
+
+    async def upload_raw(
+        self, path: str, file: FileInput, filename: str, **kwargs: Any
+    ) -> bytes:
+        response = await self._upload(path, file, filename, **kwargs)
+        return response.content
 
     async def stream(
         self, path: str, data: Optional[dict[str, Any]] = None
     ) -> AsyncIterator[dict[str, Any]]:
-        async with self._client.stream("POST", path, json=data) as response:
+        async with self._client.stream(
+            "POST", path, content=_encode_body(data)
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._check_response(response)
             async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    json_str = line[6:].strip()
-                    if json_str and json_str != "[DONE]":
-                        import json
-
-                        try:
-                            yield json.loads(json_str)
-                        except json.JSONDecodeError:
-                            pass
-
-    def set_access_token(self, token: str) -> None:
-        self.access_token = token
-        self._client.headers["Authorization"] = f"Bearer {token}"
-
-    def set_api_key(self, api_key: str) -> None:
-        self.api_key = api_key
-        self._client.headers["X-API-Key"] = api_key
+                event = _parse_sse_line(line)
+                if event is not None:
+                    yield event
 
     async def close(self) -> None:
+        if self._client.is_closed:
+            return
         await self._client.aclose()
 
 
-__all__ = ["HttpClient", "AsyncHttpClient"]
+__all__ = [
+    "HttpClient",
+    "AsyncHttpClient",
+    "SharedConnectionPool",
+    "FileInput",
+    "DEFAULT_LIMITS",
+    "pool_limits",
+]
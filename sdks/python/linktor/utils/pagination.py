@@ -0,0 +1,104 @@
+"""
+Pagination helpers
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from linktor.types.common import PaginatedResponse
+
+T = TypeVar("T")
+
+
+def next_page_params(
+    page: PaginatedResponse[Any], params: dict[str, Any]
+) -> Optional[dict[str, Any]]:
+    """Return the params for the page after ``page``, or None if it is the last"""
+    pagination = page.pagination
+    if not pagination.has_more or not page.data:
+        return None
+
+    params = dict(params)
+    if pagination.next_cursor:
+        params.pop("offset", None)
+        params["cursor"] = pagination.next_cursor
+    else:
+        params["offset"] = pagination.offset + len(page.data)
+    return params
+
+
+def iter_pages(
+    fetch: Callable[..., PaginatedResponse[T]],
+    params: dict[str, Any],
+) -> Iterator[PaginatedResponse[T]]:
+    """
+    Iterate over every page of a list endpoint
+
+    The next page is requested in a background thread while the caller
+    processes the current one, so the per-page round trip overlaps with
+    client-side work.
+
+    Args:
+        fetch: Function returning one page for the given keyword params
+        params: Params for the first page
+
+    Yields:
+        Successive pages
+    """
+    page = fetch(**params)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            next_params = next_page_params(page, params)
+            if next_params is None:
+                yield page
+                return
+
+            future = executor.submit(fetch, **next_params)
+            yield page
+            page = future.result()
+            params = next_params
+
+
+def iter_items(
+    fetch: Callable[..., PaginatedResponse[T]],
+    params: dict[str, Any],
+) -> Iterator[T]:
+    """Iterate over the items of every page of a list endpoint"""
+    for page in iter_pages(fetch, params):
+        yield from page.data
+
+
+async def aiter_pages(
+    fetch: Callable[..., Awaitable[PaginatedResponse[T]]],
+    params: dict[str, Any],
+) -> AsyncIterator[PaginatedResponse[T]]:
+    """Async counterpart of iter_pages; the next page is fetched in a task"""
+    page = await fetch(**params)
+    while True:
+        next_params = next_page_params(page, params)
+        if next_params is None:
+            yield page
+            return
+
+        task = asyncio.ensure_future(fetch(**next_params))
+        try:
+            yield page
+            page = await task
+        finally:
+            if not task.done():
+                task.cancel()
+        params = next_params
+
+
+async def aiter_items(
+    fetch: Callable[..., Awaitable[PaginatedResponse[T]]],
+    params: dict[str, Any],
+) -> AsyncIterator[T]:
+    """Iterate over the items of every page of an async list endpoint"""
+    async for page in aiter_pages(fetch, params):
+        for item in page.data:
+            yield item
+
+
+__all__ = ["next_page_params", "iter_pages", "iter_items", "aiter_pages", "aiter_items"]
@@ -0,0 +1,42 @@
+"""
+Local QR code rendering
+
+Requires the ``qr`` extra (``pip install linktor[qr]``).
+"""
+
+import io
+
+
+def render_qr(payload: str, format: str = "png", size: int = 512) -> bytes:
+    """
+    Encode ``payload`` as a square QR code image
+
+    Args:
+        payload: Data to encode
+        format: Image format (png, webp or jpeg)
+        size: Width and height of the image in pixels
+
+    Returns:
+        Encoded image bytes
+    """
+    # Imported here so ``import linktor`` does not pay for qrcode and Pillow
+    try:
+        import qrcode
+        from PIL import Image
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "Local QR rendering requires the 'qr' extra: pip install linktor[qr]"
+        ) from e
+
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M)
+    qr.add_data(payload)
+    qr.make(fit=True)
+    image = qr.make_image().get_image().convert("RGB")
+    image = image.resize((size, size), Image.NEAREST)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format=format.upper())
+    return buffer.getvalue()
+
+
+__all__ = ["render_qr"]
@@ -0,0 +1,44 @@
+"""
+JSON serialization helpers
+
+Uses orjson when it is installed (``pip install linktor[fast]``) and falls back
+to the standard library otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """Deserialize JSON from ``str`` or bytes-like input"""
+        return orjson.loads(data)
+
+else:
+    JSONDecodeError = json.JSONDecodeError  # type: ignore[misc]
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes"""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """Deserialize JSON from ``str`` or bytes-like input"""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+__all__ = ["dumps", "loads", "JSONDecodeError"]
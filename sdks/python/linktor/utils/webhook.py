@@ -2,21 +2,62 @@
 Webhook signature verification utilities
 """
 
+from __future__ import annotations
+
 import hashlib
 import hmac
-import json
 import time
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Mapping, Optional, TypeVar
 
 from linktor.types.webhook import WebhookEvent, WebhookEventType
+from linktor.utils.serialization import loads
 
 SIGNATURE_HEADER = "x-linktor-signature"
 TIMESTAMP_HEADER = "x-linktor-timestamp"
 DEFAULT_TOLERANCE = 300  # 5 minutes
+_SIGNATURE_LENGTH = 64  # hex-encoded SHA-256
 
 T = TypeVar("T")
 
 
+# Keyed state for the most recently used secret only, so a rotated-out secret
+# stops being held as soon as another one is used
+_last_keyed: Optional[tuple[str, hmac.HMAC]] = None
+
+
+def _keyed_hmac(secret: str) -> hmac.HMAC:
+    """HMAC-SHA256 with the key schedule for ``secret`` already applied"""
+    global _last_keyed
+    cached = _last_keyed
+    if cached is not None and cached[0] == secret:
+        return cached[1]
+    keyed = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+    _last_keyed = (secret, keyed)
+    return keyed
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Look up a lowercase header name without rebuilding the whole mapping"""
+    value = headers.get(name)
+    if value is not None:
+        return value
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _mac(payload: str | bytes, secret: str) -> hmac.HMAC:
+    """HMAC-SHA256 of ``payload`` under ``secret``"""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+
+    # Copying the keyed state skips re-deriving the inner/outer pads
+    mac = _keyed_hmac(secret).copy()
+    mac.update(payload)
+    return mac
+
+
 def compute_signature(payload: str | bytes, secret: str) -> str:
     """
     Compute HMAC-SHA256 signature
@@ -28,14 +69,7 @@ def compute_signature(payload: str | bytes, secret: str) -> str:
     Returns:
         Hex-encoded signature
     """
-    if isinstance(payload, str):
-        payload = payload.encode("utf-8")
-
-    return hmac.new(
-        secret.encode("utf-8"),
-        payload,
-        hashlib.sha256,
-    ).hexdigest()
+    return _mac(payload, secret).hexdigest()
 
 
 def verify_webhook_signature(
@@ -57,15 +91,22 @@ def verify_webhook_signature(
     if not signature or not secret:
         return False
 
-    expected_signature = compute_signature(payload, secret)
+    # Depends only on the header's shape, so it leaks nothing about the secret
+    if len(signature) != _SIGNATURE_LENGTH:
+        return False
 
-    # Timing-safe comparison
-    return hmac.compare_digest(signature, expected_signature)
+    try:
+        signature_bytes = bytes.fromhex(signature)
+    except ValueError:
+        return False
+
+    # Timing-safe comparison of the raw digests
+    return hmac.compare_digest(signature_bytes, _mac(payload, secret).digest())
 
 
 def verify_webhook(
     payload: str | bytes,
-    headers: dict[str, str],
+    headers: Mapping[str, str],
     secret: str,
     tolerance: int = DEFAULT_TOLERANCE,
 ) -> bool:
@@ -74,18 +115,16 @@ def verify_webhook(
 
     Args:
         payload: Raw request body
-        headers: Request headers (case-insensitive)
+        headers: Request headers; lowercase keys or a case-insensitive mapping
+            (httpx/Starlette ``Headers``) are looked up directly
         secret: Webhook secret
         tolerance: Maximum age of the webhook in seconds
 
     Returns:
         True if signature and timestamp are valid
     """
-    # Normalize header keys to lowercase
-    headers_lower = {k.lower(): v for k, v in headers.items()}
-
-    signature = headers_lower.get(SIGNATURE_HEADER)
-    timestamp = headers_lower.get(TIMESTAMP_HEADER)
+    signature = _get_header(headers, SIGNATURE_HEADER)
+    timestamp = _get_header(headers, TIMESTAMP_HEADER)
 
     if not signature:
         return False
@@ -94,18 +133,17 @@ def verify_webhook(
     if timestamp:
         try:
             webhook_time = int(timestamp)
-            now = int(time.time())
-            if abs(now - webhook_time) > tolerance:
-                return False
         except ValueError:
             return False
+        if abs(time.time() - webhook_time) > tolerance:
+            return False
 
     return verify_webhook_signature(payload, signature, secret)
 
 
 def construct_event(
     payload: str | bytes,
-    headers: dict[str, str],
+    headers: Mapping[str, str],
     secret: str,
     tolerance: int = DEFAULT_TOLERANCE,
 ) -> WebhookEvent[Any]:
@@ -124,21 +162,20 @@ def construct_event(
     Raises:
         ValueError: If verification fails or payload is invalid
     """
+    # Encode once; the HMAC and the JSON parser both read the same bytes
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+
     if not verify_webhook(payload, headers, secret, tolerance):
         raise ValueError("Webhook signature verification failed")
 
-    if isinstance(payload, bytes):
-        payload = payload.decode("utf-8")
-
-    try:
-        data = json.loads(payload)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON payload: {e}")
+    # JSONDecodeError is a ValueError for both the orjson and stdlib backends
+    data = loads(payload)
 
     if not data.get("id") or not data.get("type") or not data.get("timestamp"):
         raise ValueError("Invalid webhook event structure")
 
-    return WebhookEvent(**data)
+    return WebhookEvent.model_validate(data)
 
 
 def is_event_type(event: WebhookEvent[Any], event_type: WebhookEventType) -> bool:
@@ -162,7 +199,7 @@ def create_webhook_handler(
     secret: str,
     handlers: dict[WebhookEventType, WebhookHandler],
     tolerance: int = DEFAULT_TOLERANCE,
-) -> Callable[[str | bytes, dict[str, str]], tuple[int, Optional[str]]]:
+) -> Callable[[str | bytes, Mapping[str, str]], tuple[int, Optional[str]]]:
     """
     Create a webhook handler factory
 
@@ -177,7 +214,7 @@ def create_webhook_handler(
 
     def handle_webhook(
         payload: str | bytes,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
     ) -> tuple[int, Optional[str]]:
         try:
             event = construct_event(payload, headers, secret, tolerance)
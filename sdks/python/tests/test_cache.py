@@ -0,0 +1,128 @@
+"""Tests for ResponseCache"""
+
+import threading
+import time
+
+import pytest
+
+from linktor.utils.cache import ResponseCache, make_cache_key, resource_prefix
+
+
+class TestResponseCache:
+    """Tests for ResponseCache"""
+
+    def test_concurrent_fetches_are_coalesced(self):
+        """Should run a single fetch for concurrent misses on one key"""
+        cache = ResponseCache(ttl=60)
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_fetch(("/a", ()), fetch))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+
+    def test_entries_expire(self):
+        """Should refetch once the TTL has passed"""
+        cache = ResponseCache(ttl=0.01)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_fetch(("/a", ()), fetch) == 1
+        time.sleep(0.02)
+        assert cache.get_or_fetch(("/a", ()), fetch) == 2
+
+    def test_fetch_errors_are_not_cached(self):
+        """Should propagate fetch errors and retry on the next call"""
+        cache = ResponseCache(ttl=60)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get_or_fetch(("/a", ()), fail)
+        assert cache.get_or_fetch(("/a", ()), lambda: "ok") == "ok"
+
+    def test_max_age_caps_ttl(self):
+        """Should expire entries after max_age when it is below the TTL"""
+        cache = ResponseCache(ttl=60)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_fetch(("/a", ()), fetch, max_age=0.01) == 1
+        time.sleep(0.02)
+        assert cache.get_or_fetch(("/a", ()), fetch, max_age=0.01) == 2
+
+    def test_stale_value_on_error(self):
+        """Should serve the expired value when stale_if accepts the error"""
+        cache = ResponseCache(ttl=0.01)
+        cache.get_or_fetch(("/a", ()), lambda: "old")
+        time.sleep(0.02)
+
+        def fail():
+            raise ConnectionError("down")
+
+        assert cache.get_or_fetch(("/a", ()), fail, stale_if=lambda e: True) == "old"
+        with pytest.raises(ConnectionError):
+            cache.get_or_fetch(("/a", ()), fail)
+
+    def test_invalidate_prefix(self):
+        """Should drop only entries under the given resource"""
+        cache = ResponseCache(ttl=60)
+        cache.get_or_fetch(("/contacts", ()), lambda: 1)
+        cache.get_or_fetch(("/contacts/1", ()), lambda: 2)
+        cache.get_or_fetch(("/contactsx", ()), lambda: 3)
+
+        cache.invalidate("/contacts")
+
+        assert cache.get_or_fetch(("/contacts/1", ()), lambda: "new") == "new"
+        assert cache.get_or_fetch(("/contactsx", ()), lambda: "new") == 3
+
+    def test_maxsize_evicts_oldest(self):
+        """Should evict the least recently used entry"""
+        cache = ResponseCache(ttl=60, maxsize=2)
+        cache.get_or_fetch(("/a", ()), lambda: 1)
+        cache.get_or_fetch(("/b", ()), lambda: 2)
+        cache.get_or_fetch(("/a", ()), lambda: 0)
+        cache.get_or_fetch(("/c", ()), lambda: 3)
+
+        assert cache.get_or_fetch(("/a", ()), lambda: "new") == 1
+        assert cache.get_or_fetch(("/b", ()), lambda: "new") == "new"
+
+
+class TestCacheKeys:
+    """Tests for cache key helpers"""
+
+    def test_make_cache_key_ignores_param_order(self):
+        """Should produce the same key regardless of param order"""
+        assert make_cache_key("/a", {"x": 1, "y": 2}) == make_cache_key(
+            "/a", {"y": 2, "x": 1}
+        )
+
+    def test_resource_prefix(self):
+        """Should return the top-level resource path"""
+        assert resource_prefix("/contacts/1/tags") == "/contacts"
+        assert resource_prefix("contacts") == "/contacts"
@@ -1,8 +1,70 @@
 """Tests for LinktorClient"""
 
+import asyncio
+import json
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from linktor.client import LinktorClient, LinktorAsyncClient
+from linktor.types import CreateContactInput
+
+
+RESOURCE_SURFACE = {
+    "auth": ["login", "logout", "refresh_token", "get_current_user"],
+    "conversations": [
+        "list",
+        "get",
+        "update",
+        "send_message",
+        "send_text",
+        "list_messages",
+        "resolve",
+        "assign",
+    ],
+    "contacts": ["list", "get", "create", "update", "delete", "search"],
+    "channels": ["list", "get", "create", "update", "delete", "connect", "disconnect"],
+    "bots": ["list", "get", "create", "update", "delete", "activate", "deactivate"],
+    "ai": ["agents", "completions", "embeddings"],
+    "ai.agents": ["list", "get", "create", "update", "delete", "invoke"],
+    "ai.completions": ["create", "complete", "stream"],
+    "ai.embeddings": ["create", "embed", "embed_many"],
+    "knowledge_bases": [
+        "list",
+        "get",
+        "create",
+        "update",
+        "delete",
+        "query",
+        "search",
+        "list_documents",
+        "upload_document",
+        "delete_document",
+    ],
+    "flows": [
+        "list",
+        "get",
+        "create",
+        "update",
+        "delete",
+        "execute",
+        "activate",
+        "deactivate",
+    ],
+    "analytics": [
+        "get_dashboard",
+        "get_conversation_metrics",
+        "get_message_metrics",
+        "get_realtime",
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client shared by the tests that only inspect its resources"""
+    client = LinktorClient()
+    yield client
+    client.close()
 
 
 class TestLinktorClient:
@@ -48,6 +110,14 @@ class TestLinktorClient:
 
         assert client is not None
 
+    def test_pool_limits(self):
+        """Should size the connection pool from the constructor"""
+        client = LinktorClient(pool_max_connections=10, pool_max_keepalive=5)
+        pool = client._http._client._transport._pool
+
+        assert pool._max_connections == 10
+        assert pool._max_keepalive_connections == 5
+
     def test_set_api_key(self):
         """Should update API key"""
         client = LinktorClient()
@@ -102,174 +172,294 @@ class TestLinktorAsyncClient:
 
         assert client is not None
 
+    def test_async_resources_exist(self):
+        """Should expose the same resources as the sync client"""
+        client = LinktorAsyncClient()
 
-class TestAuthResource:
-    """Tests for AuthResource"""
+        for name in (
+            "auth",
+            "conversations",
+            "contacts",
+            "channels",
+            "bots",
+            "ai",
+            "knowledge_bases",
+            "flows",
+            "analytics",
+            "vre",
+        ):
+            assert getattr(client, name) is not None
+        assert hasattr(client.ai, "agents")
+
+    async def test_bulk_get(self):
+        """Should fetch ids concurrently up to the limit and keep the input order"""
+        client = LinktorAsyncClient()
+        in_flight, peak = [], []
+
+        async def get_raw(path):
+            in_flight.append(path)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(path)
+            return json.dumps({
+                "id": path.rsplit("/", 1)[1],
+                "tenantId": "t-1",
+                "name": "Ana",
+                "identifiers": [],
+                "conversationCount": 0,
+                "createdAt": "2024-01-01T00:00:00Z",
+                "updatedAt": "2024-01-01T00:00:00Z",
+            }).encode()
+
+        client._http.get_raw = AsyncMock(side_effect=get_raw)
+        ids = [f"c-{i}" for i in range(6)]
+
+        contacts = await client.contacts.bulk_get(ids, concurrency=2)
+
+        assert [contact.id for contact in contacts] == ids
+        assert max(peak) == 2
+        assert client._http.get_raw.await_count == 6
+
+    async def test_get_realtime_not_cached(self):
+        """Should fetch realtime metrics from the API on every call"""
+        client = LinktorAsyncClient()
+        client._http.get = AsyncMock(return_value={"activeConversations": 3})
 
-    def test_auth_resource_exists(self):
-        """Should have auth resource"""
-        client = LinktorClient()
+        await client.analytics.get_realtime()
+        await client.analytics.get_realtime()
 
-        assert client.auth is not None
-        assert hasattr(client.auth, "login")
-        assert hasattr(client.auth, "logout")
-        assert hasattr(client.auth, "refresh_token")
-        assert hasattr(client.auth, "get_current_user")
+        assert client._http.get.await_count == 2
+        client._http.get.assert_awaited_with("/analytics/realtime")
+        await client.close()
 
+    async def test_complete_many(self):
+        """Should run completions concurrently up to the limit and keep prompt order"""
+        client = LinktorAsyncClient()
+        in_flight, peak = [], []
 
-class TestConversationsResource:
-    """Tests for ConversationsResource"""
+        async def post(path, data):
+            in_flight.append(data)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(data)
+            return {"message": {"content": data["messages"][0]["content"].upper()}}
 
-    def test_conversations_resource_exists(self):
-        """Should have conversations resource"""
-        client = LinktorClient()
+        client._http.post = AsyncMock(side_effect=post)
 
-        assert client.conversations is not None
-        assert hasattr(client.conversations, "list")
-        assert hasattr(client.conversations, "get")
-        assert hasattr(client.conversations, "update")
-        assert hasattr(client.conversations, "send_message")
-        assert hasattr(client.conversations, "send_text")
-        assert hasattr(client.conversations, "list_messages")
-        assert hasattr(client.conversations, "resolve")
-        assert hasattr(client.conversations, "assign")
+        answers = await client.ai.completions.complete_many(["a", "b", "c", "d"], concurrency=2)
+
+        assert answers == ["A", "B", "C", "D"]
+        assert max(peak) == 2
+        assert client._http.post.await_count == 4
+        await client.close()
+
+
+class TestResourceSurface:
+    """Tests for the methods each resource exposes"""
+
+    @pytest.mark.parametrize("path,methods", RESOURCE_SURFACE.items())
+    def test_resource_surface(self, client, path, methods):
+        """Should expose every listed method on the resource"""
+        resource = client
+        for name in path.split("."):
+            resource = getattr(resource, name)
+
+        for method in methods:
+            assert getattr(resource, method, None) is not None, f"{path} missing {method}"
+
+
+class TestAuthResource:
+    """Tests for AuthResource"""
+
+    def test_current_user_cached_per_token(self):
+        """Should reuse the user until the credentials change or refresh is asked for"""
+        client = LinktorClient(access_token="token-1")
+        client._http.get_raw = Mock(return_value=json.dumps({
+            "id": "u-1",
+            "email": "ana@example.com",
+            "name": "Ana",
+            "role": "admin",
+            "tenantId": "t-1",
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+        }).encode())
+
+        assert client.auth.get_current_user().id == "u-1"
+        client.auth.get_current_user()
+        assert client._http.get_raw.call_count == 1
+
+        client.auth.get_current_user(refresh=True)
+        client.set_access_token("token-2")
+        client.auth.get_current_user()
+        assert client._http.get_raw.call_count == 3
 
 
 class TestContactsResource:
     """Tests for ContactsResource"""
 
-    def test_contacts_resource_exists(self):
-        """Should have contacts resource"""
+    CONTACT = {
+        "id": "c-1",
+        "tenantId": "t-1",
+        "name": "Ana",
+        "identifiers": [],
+        "conversationCount": 0,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+    def test_get_and_update_use_resource_path(self):
+        """Should request the contact path and parse a Contact"""
+        contact = self.CONTACT
         client = LinktorClient()
+        client._http.get_raw = Mock(return_value=json.dumps(contact).encode())
+        client._http.patch_raw = Mock(return_value=json.dumps(contact).encode())
 
-        assert client.contacts is not None
-        assert hasattr(client.contacts, "list")
-        assert hasattr(client.contacts, "get")
-        assert hasattr(client.contacts, "create")
-        assert hasattr(client.contacts, "update")
-        assert hasattr(client.contacts, "delete")
-        assert hasattr(client.contacts, "search")
+        assert client.contacts.get("c-1").name == "Ana"
+        assert client.contacts.update("c-1", name="Ana").id == "c-1"
+        client._http.get_raw.assert_called_once_with("/contacts/c-1")
+        client._http.patch_raw.assert_called_once_with("/contacts/c-1", {"name": "Ana"})
 
+    def test_bulk_get_keeps_input_order(self):
+        """Should fetch every id on the thread pool and keep the input order"""
+        client = LinktorClient()
+        client._http.get_raw = Mock(
+            side_effect=lambda path: json.dumps(
+                {**self.CONTACT, "id": path.rsplit("/", 1)[1]}
+            ).encode()
+        )
 
-class TestChannelsResource:
-    """Tests for ChannelsResource"""
+        contacts = client.contacts.bulk_get(["c-1", "c-2", "c-3"])
 
-    def test_channels_resource_exists(self):
-        """Should have channels resource"""
-        client = LinktorClient()
+        assert [contact.id for contact in contacts] == ["c-1", "c-2", "c-3"]
+        assert client._http.get_raw.call_count == 3
 
-        assert client.channels is not None
-        assert hasattr(client.channels, "list")
-        assert hasattr(client.channels, "get")
-        assert hasattr(client.channels, "create")
-        assert hasattr(client.channels, "update")
-        assert hasattr(client.channels, "delete")
-        assert hasattr(client.channels, "connect")
-        assert hasattr(client.channels, "disconnect")
+    def test_create_sends_aliased_fields(self):
+        """Should send camelCase keys, keep explicit None values and unknown keys"""
+        client = LinktorClient()
+        client._http.post_raw = Mock(return_value=json.dumps(self.CONTACT).encode())
 
+        client.contacts.create(
+            name="Ana", custom_fields={"plan": "pro"}, email=None, source="import"
+        )
 
-class TestBotsResource:
-    """Tests for BotsResource"""
+        client._http.post_raw.assert_called_once_with(
+            "/contacts",
+            {"name": "Ana", "customFields": {"plan": "pro"}, "email": None, "source": "import"},
+        )
 
-    def test_bots_resource_exists(self):
-        """Should have bots resource"""
+    def test_update_sends_explicit_none(self):
+        """Should send an explicit None so PATCH can clear a field, omitting unset ones"""
         client = LinktorClient()
+        client._http.patch_raw = Mock(return_value=json.dumps(self.CONTACT).encode())
 
-        assert client.bots is not None
-        assert hasattr(client.bots, "list")
-        assert hasattr(client.bots, "get")
-        assert hasattr(client.bots, "create")
-        assert hasattr(client.bots, "update")
-        assert hasattr(client.bots, "delete")
-        assert hasattr(client.bots, "activate")
-        assert hasattr(client.bots, "deactivate")
+        client.contacts.update("c-1", email=None)
 
+        client._http.patch_raw.assert_called_once_with("/contacts/c-1", {"email": None})
 
-class TestAIResource:
-    """Tests for AIResource"""
-
-    def test_ai_resource_exists(self):
-        """Should have AI resource with sub-resources"""
+    def test_create_accepts_input_model(self):
+        """Should serialize an input model passed positionally"""
         client = LinktorClient()
+        client._http.post_raw = Mock(return_value=json.dumps(self.CONTACT).encode())
 
-        assert client.ai is not None
-        assert client.ai.agents is not None
-        assert client.ai.completions is not None
-        assert client.ai.embeddings is not None
+        client.contacts.create(CreateContactInput(name="Ana", external_id="x-1"))
+
+        client._http.post_raw.assert_called_once_with(
+            "/contacts", {"name": "Ana", "externalId": "x-1"}
+        )
 
-    def test_agents_subresource(self):
-        """Should have agents sub-resource"""
+    def test_list_parses_page(self):
+        """Should parse a page of contacts"""
+        page = {
+            "data": [],
+            "pagination": {"total": 0, "limit": 20, "offset": 0, "hasMore": False},
+        }
         client = LinktorClient()
+        client._http.get_raw = Mock(return_value=json.dumps(page).encode())
 
-        assert hasattr(client.ai.agents, "list")
-        assert hasattr(client.ai.agents, "get")
-        assert hasattr(client.ai.agents, "create")
-        assert hasattr(client.ai.agents, "update")
-        assert hasattr(client.ai.agents, "delete")
-        assert hasattr(client.ai.agents, "invoke")
+        result = client.contacts.list(limit=20)
+
+        assert result.data == []
+        assert result.pagination.has_more is False
+        client._http.get_raw.assert_called_once_with("/contacts", params={"limit": 20})
 
-    def test_completions_subresource(self):
-        """Should have completions sub-resource"""
-        client = LinktorClient()
 
-        assert hasattr(client.ai.completions, "create")
-        assert hasattr(client.ai.completions, "complete")
+class TestAIResource:
+    """Tests for AIResource"""
 
-    def test_embeddings_subresource(self):
-        """Should have embeddings sub-resource"""
+    def test_embed_many_uses_single_request(self):
+        """Should embed a batch of texts with one request"""
         client = LinktorClient()
+        client._http.post = Mock(
+            return_value={"data": [{"index": 0, "embedding": [0.1]}, {"index": 1, "embedding": [0.2]}]}
+        )
 
-        assert hasattr(client.ai.embeddings, "create")
-        assert hasattr(client.ai.embeddings, "embed")
+        assert client.ai.embeddings.embed_many(["a", "b"]) == [[0.1], [0.2]]
+        client._http.post.assert_called_once_with("/ai/embeddings", {"input": ["a", "b"]})
 
 
 class TestKnowledgeBasesResource:
     """Tests for KnowledgeBasesResource"""
 
-    def test_knowledge_bases_resource_exists(self):
-        """Should have knowledge bases resource"""
+    def test_upload_document_parses_raw_body(self):
+        """Should validate the upload response bytes into a Document"""
         client = LinktorClient()
+        client._http.upload_raw = Mock(return_value=json.dumps({
+            "id": "doc-1",
+            "knowledgeBaseId": "kb-1",
+            "name": "faq.txt",
+            "type": "txt",
+            "status": "pending",
+            "size": 5,
+            "chunkCount": 0,
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+        }).encode())
+
+        document = client.knowledge_bases.upload_document("kb-1", b"hello", "faq.txt")
+
+        assert document.knowledge_base_id == "kb-1"
+        client._http.upload_raw.assert_called_once_with(
+            "/knowledge-bases/kb-1/documents", b"hello", "faq.txt"
+        )
 
-        assert client.knowledge_bases is not None
-        assert hasattr(client.knowledge_bases, "list")
-        assert hasattr(client.knowledge_bases, "get")
-        assert hasattr(client.knowledge_bases, "create")
-        assert hasattr(client.knowledge_bases, "update")
-        assert hasattr(client.knowledge_bases, "delete")
-        assert hasattr(client.knowledge_bases, "query")
-        assert hasattr(client.knowledge_bases, "search")
-        assert hasattr(client.knowledge_bases, "list_documents")
-        assert hasattr(client.knowledge_bases, "upload_document")
-        assert hasattr(client.knowledge_bases, "delete_document")
-
-
-class TestFlowsResource:
-    """Tests for FlowsResource"""
-
-    def test_flows_resource_exists(self):
-        """Should have flows resource"""
-        client = LinktorClient()
 
-        assert client.flows is not None
-        assert hasattr(client.flows, "list")
-        assert hasattr(client.flows, "get")
-        assert hasattr(client.flows, "create")
-        assert hasattr(client.flows, "update")
-        assert hasattr(client.flows, "delete")
-        assert hasattr(client.flows, "execute")
-        assert hasattr(client.flows, "activate")
-        assert hasattr(client.flows, "deactivate")
+class TestVREResource:
+    """Tests for VREResource"""
 
+    RENDER_RESPONSE = {
+        "imageBase64": "aW1n",
+        "caption": "Menu",
+        "width": 800,
+        "height": 600,
+        "format": "png",
+        "renderTimeMs": 12,
+    }
 
-class TestAnalyticsResource:
-    """Tests for AnalyticsResource"""
-
-    def test_analytics_resource_exists(self):
-        """Should have analytics resource"""
+    def test_render_pix_payment_local(self):
+        """Should render the QR code without calling the API"""
+        pytest.importorskip("qrcode")
         client = LinktorClient()
+        client._http.post = Mock()
 
-        assert client.analytics is not None
-        assert hasattr(client.analytics, "get_dashboard")
-        assert hasattr(client.analytics, "get_conversation_metrics")
-        assert hasattr(client.analytics, "get_message_metrics")
-        assert hasattr(client.analytics, "get_realtime")
+        image = client.vre.render_pix_payment_local("00020126580014br.gov.bcb.pix", size=128)
+
+        assert image.startswith(b"\x89PNG")
+        client._http.post.assert_not_called()
+
+    def test_render_menu_omits_unset_fields(self):
+        """Should only send the fields that were provided"""
+        client = LinktorClient()
+        client._http.post_raw = Mock(return_value=json.dumps(self.RENDER_RESPONSE).encode())
+
+        response = client.vre.render_menu("tenant-1", "Menu", [{"label": "A"}])
+
+        assert response.caption == "Menu"
+        client._http.post_raw.assert_called_once_with(
+            "/vre/render",
+            {
+                "tenant_id": "tenant-1",
+                "template_id": "menu_opcoes",
+                "data": {"titulo": "Menu", "opcoes": [{"label": "A"}]},
+                "channel": "whatsapp",
+            },
+        )
@@ -0,0 +1,510 @@
+"""Tests for HttpClient"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+
+from linktor.utils import http as http_module
+from linktor.utils.errors import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+from linktor.utils.http import (
+    MAX_RETRY_DELAY,
+    AsyncHttpClient,
+    HttpClient,
+    SharedConnectionPool,
+    pool_limits,
+)
+
+
+def make_http_client(handler, **kwargs):
+    """Create an HttpClient whose requests are served by ``handler``"""
+    kwargs.setdefault("max_retries", 0)
+    http = HttpClient(base_url="https://api.test", **kwargs)
+    http._client = httpx.Client(
+        base_url=http.base_url,
+        headers=http._build_headers(),
+        transport=httpx.MockTransport(handler),
+    )
+    return http
+
+
+class TestHttpClient:
+    """Tests for HttpClient"""
+
+    def test_post_sends_json_body(self):
+        """Should encode the request body as JSON"""
+        seen = {}
+
+        def handler(request):
+            seen["content_type"] = request.headers["content-type"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"ok": True})
+
+        http = make_http_client(handler)
+
+        assert http.post("/items", {"name": "café", "count": 2}) == {"ok": True}
+        assert seen["content_type"] == "application/json"
+        assert seen["body"] == {"name": "café", "count": 2}
+
+    def test_post_without_body(self):
+        """Should send an empty body when no data is given"""
+
+        def handler(request):
+            assert request.content == b""
+            return httpx.Response(204)
+
+        http = make_http_client(handler)
+
+        assert http.post("/items/1/connect") is None
+
+    def test_get_raw_returns_body_bytes(self):
+        """Should return the undecoded response body"""
+
+        def handler(request):
+            return httpx.Response(200, content=b'{"id":"1"}')
+
+        http = make_http_client(handler)
+
+        assert http.get_raw("/items/1") == b'{"id":"1"}'
+
+    def test_upload_sends_multipart_body(self, tmp_path):
+        """Should send files as multipart regardless of the JSON default header"""
+        seen = []
+
+        def handler(request):
+            request.read()
+            seen.append((request.headers["content-type"], request.content))
+            return httpx.Response(200, json={"id": "doc-1"})
+
+        http = make_http_client(handler)
+        path = tmp_path / "faq.txt"
+        path.write_bytes(b"hello")
+
+        with open(path, "rb") as f:
+            http.upload("/documents", f, "faq.txt")
+        http.upload("/documents", path, "faq.txt")
+        http.upload("/documents", b"hello", "faq.txt")
+
+        for content_type, body in seen:
+            boundary = content_type.split("boundary=")[1]
+            assert content_type.startswith("multipart/form-data")
+            assert body.startswith(f"--{boundary}".encode())
+            assert b'filename="faq.txt"' in body
+            assert b"hello" in body
+
+    def test_http2_enabled(self):
+        """Should negotiate HTTP/2 when requested"""
+        pytest.importorskip("h2")
+        http = HttpClient(base_url="https://api.test", http2=True)
+
+        assert http._client._transport._pool._http2 is True
+        http.close()
+
+    def test_http2_without_h2_names_extra(self, monkeypatch):
+        """Should point at the http2 extra when h2 is not installed"""
+        monkeypatch.setitem(sys.modules, "h2", None)
+
+        with pytest.raises(ImportError, match=r"linktor\[http2\]"):
+            HttpClient(base_url="https://api.test", http2=True)
+        with pytest.raises(ImportError, match=r"linktor\[http2\]"):
+            AsyncHttpClient(base_url="https://api.test", http2=True)
+
+    def test_error_response(self):
+        """Should raise a typed error from the response body"""
+
+        def handler(request):
+            return httpx.Response(404, json={"message": "missing"})
+
+        http = make_http_client(handler)
+
+        with pytest.raises(NotFoundError):
+            http.get("/items/1")
+
+    def test_stream_yields_sse_events(self):
+        """Should decode each SSE data line and stop at [DONE]"""
+
+        def handler(request):
+            body = (
+                'data: {"id": "1", "delta": {"content": "Hel"}}\n\n'
+                ": keep-alive\n\n"
+                'data: {"id": "1", "delta": {"content": "lo"}}\n\n'
+                "data: [DONE]\n\n"
+            )
+            return httpx.Response(200, text=body)
+
+        http = make_http_client(handler)
+
+        events = list(http.stream("/ai/completions", {"stream": True}))
+
+        assert [e["delta"]["content"] for e in events] == ["Hel", "lo"]
+
+    def test_stream_raises_on_error_status(self):
+        """Should raise a typed error before streaming"""
+
+        def handler(request):
+            return httpx.Response(401, json={"message": "expired"})
+
+        http = make_http_client(handler)
+
+        with pytest.raises(AuthenticationError):
+            list(http.stream("/ai/completions"))
+
+
+class TestRetries:
+    """Tests for retry backoff"""
+
+    def test_honours_retry_after_header(self, monkeypatch):
+        """Should sleep for the server's Retry-After on 429 before retrying"""
+        sleeps = []
+        monkeypatch.setattr(http_module.time, "sleep", sleeps.append)
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "7"}, json={"message": "slow down"}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+
+        http = make_http_client(lambda request: next(responses), max_retries=1)
+
+        assert http.get("/items") == {"ok": True}
+        assert sleeps == [7.0]
+
+    def test_caps_retry_after(self, monkeypatch):
+        """Should never sleep longer than MAX_RETRY_DELAY for a huge Retry-After"""
+        sleeps = []
+        monkeypatch.setattr(http_module.time, "sleep", sleeps.append)
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "86400"}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+
+        http = make_http_client(lambda request: next(responses), max_retries=1)
+
+        assert http.get("/items") == {"ok": True}
+        assert sleeps == [MAX_RETRY_DELAY]
+
+    @pytest.mark.parametrize("retry_after", ["soon", -5, True, None])
+    def test_ignores_invalid_body_retry_after(self, monkeypatch, retry_after):
+        """Should fall back to jittered backoff when the body's retry_after is unusable"""
+        sleeps = []
+        monkeypatch.setattr(http_module.time, "sleep", sleeps.append)
+        responses = iter([
+            httpx.Response(429, json={"message": "slow down", "retry_after": retry_after}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+
+        http = make_http_client(lambda request: next(responses), max_retries=1, retry_delay=1.0)
+
+        assert http.get("/items") == {"ok": True}
+        assert len(sleeps) == 1
+        assert 1.0 <= sleeps[0] <= MAX_RETRY_DELAY
+
+    @pytest.mark.parametrize("content", [b'["slow down"]', b'"slow down"', b""])
+    def test_rate_limit_with_non_object_body(self, content):
+        """Should raise RateLimitError even when the 429 body is not a JSON object"""
+        http = make_http_client(
+            lambda request: httpx.Response(429, headers={"Retry-After": "7"}, content=content)
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            http.get("/items")
+        assert exc_info.value.retry_after == 7
+
+    def test_ignores_non_ascii_retry_after(self):
+        """Should treat Unicode digits in Retry-After as missing"""
+        http = make_http_client(
+            lambda request: httpx.Response(429, headers={"Retry-After": b"\xb2"})
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            http.get("/items")
+        assert exc_info.value.retry_after is None
+
+    def test_jittered_backoff_is_bounded(self, monkeypatch):
+        """Should keep every backoff between the base delay and the cap"""
+        sleeps = []
+        monkeypatch.setattr(http_module.time, "sleep", sleeps.append)
+
+        http = make_http_client(
+            lambda request: httpx.Response(503), max_retries=5, retry_delay=1.0
+        )
+
+        with pytest.raises(ServerError):
+            http.get("/items")
+        assert len(sleeps) == 5
+        assert all(1.0 <= delay <= MAX_RETRY_DELAY for delay in sleeps)
+
+
+def require_token(token):
+    """Handler that rejects requests not authorized with ``token``"""
+
+    def handler(request):
+        if request.headers.get("authorization") != f"Bearer {token}":
+            return httpx.Response(401, json={"message": "expired"})
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+class TestTokenRefresh:
+    """Tests for refreshing the access token on 401"""
+
+    def test_concurrent_401s_refresh_once(self):
+        """Should run a single refresh for requests rejected at the same time"""
+        refreshes = []
+
+        def refresh():
+            refreshes.append(1)
+            time.sleep(0.05)
+            return "new"
+
+        http = make_http_client(
+            require_token("new"), access_token="old", on_token_refresh=refresh
+        )
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(http.get("/me")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{"ok": True}] * 5
+        assert len(refreshes) == 1
+        assert http.access_token == "new"
+
+    def test_401_without_refresh_callback(self):
+        """Should raise when no refresh callback is configured"""
+        http = make_http_client(require_token("new"), access_token="old")
+
+        with pytest.raises(AuthenticationError):
+            http.get("/me")
+
+    def test_reentrant_refresh_raises(self):
+        """Should raise instead of deadlocking when the refresh callback gets a 401"""
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            return http.get("/auth/me")["token"]
+
+        http = make_http_client(require_token("new"), access_token="old", on_token_refresh=refresh)
+
+        with pytest.raises(AuthenticationError):
+            http.get("/me")
+        assert len(calls) == 1
+
+    def test_auth_endpoints_not_refreshed(self):
+        """Should not refresh when login or refresh itself is rejected"""
+        refreshes = []
+        http = make_http_client(
+            require_token("new"),
+            access_token="old",
+            on_token_refresh=lambda: refreshes.append(1) or "new",
+        )
+
+        with pytest.raises(AuthenticationError):
+            http.post("/auth/login", {"email": "a", "password": "b"})
+        with pytest.raises(AuthenticationError):
+            http.post("/auth/refresh", {"refreshToken": "r"})
+        assert refreshes == []
+
+    async def test_async_concurrent_401s_refresh_once(self):
+        """Should run a single (possibly async) refresh for concurrent tasks"""
+        refreshes = []
+
+        async def refresh():
+            refreshes.append(1)
+            await asyncio.sleep(0.01)
+            return "new"
+
+        http = AsyncHttpClient(
+            base_url="https://api.test",
+            access_token="old",
+            max_retries=0,
+            on_token_refresh=refresh,
+        )
+        http._client = httpx.AsyncClient(
+            base_url=http.base_url,
+            headers=http._build_headers(),
+            transport=httpx.MockTransport(require_token("new")),
+        )
+
+        results = await asyncio.gather(*(http.get("/me") for _ in range(5)))
+
+        assert results == [{"ok": True}] * 5
+        assert len(refreshes) == 1
+        await http.close()
+
+
+    async def test_async_reentrant_refresh_raises(self):
+        """Should raise instead of deadlocking when the async callback gets a 401"""
+        calls = []
+
+        async def refresh():
+            calls.append(1)
+            return (await http.get("/auth/me"))["token"]
+
+        http = AsyncHttpClient(
+            base_url="https://api.test",
+            access_token="old",
+            max_retries=0,
+            on_token_refresh=refresh,
+        )
+        http._client = httpx.AsyncClient(
+            base_url=http.base_url,
+            headers=http._build_headers(),
+            transport=httpx.MockTransport(require_token("new")),
+        )
+
+        with pytest.raises(AuthenticationError):
+            await asyncio.wait_for(http.get("/me"), timeout=5)
+        assert len(calls) == 1
+        await http.close()
+
+
+class TestAsyncHttpClient:
+    """Tests for AsyncHttpClient"""
+
+    async def test_close_is_idempotent(self):
+        """Should close the shared client once and ignore later calls"""
+        http = AsyncHttpClient(base_url="https://api.test")
+
+        await http.close()
+        await http.close()
+
+        assert http._client.is_closed
+
+
+class TestResponseCaching:
+    """Tests for HttpClient GET caching"""
+
+    def test_get_is_cached(self):
+        """Should serve repeated GETs from the cache"""
+        calls = []
+
+        def handler(request):
+            calls.append(str(request.url))
+            return httpx.Response(200, json={"id": "1"})
+
+        http = make_http_client(handler, cache_ttl=60)
+
+        assert http.get("/contacts/1") == {"id": "1"}
+        assert http.get("/contacts/1") == {"id": "1"}
+        assert http.get("/contacts/1", {"expand": "tags"}) == {"id": "1"}
+        assert len(calls) == 2
+
+    def test_write_invalidates_resource(self):
+        """Should drop cached GETs of a resource after writing to it"""
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, request.url.path))
+            return httpx.Response(200, json={})
+
+        http = make_http_client(handler, cache_ttl=60)
+
+        http.get("/contacts/1")
+        http.get("/channels")
+        http.patch("/contacts/1", {"name": "New"})
+        http.get("/contacts/1")
+        http.get("/channels")
+
+        assert calls == [
+            ("GET", "/contacts/1"),
+            ("GET", "/channels"),
+            ("PATCH", "/contacts/1"),
+            ("GET", "/contacts/1"),
+        ]
+
+    def test_stale_response_on_server_error(self):
+        """Should fall back to the last response when the API fails"""
+        responses = iter([httpx.Response(200, json={"v": 1}), httpx.Response(503)])
+
+        http = make_http_client(
+            lambda request: next(responses), cache_ttl=60, cache_stale_on_error=True
+        )
+
+        assert http.get("/analytics/dashboard") == {"v": 1}
+        time.sleep(0.01)
+        assert http.get("/analytics/dashboard", max_age=0.001) == {"v": 1}
+        with pytest.raises(StopIteration):
+            next(responses)
+
+    def test_unchanged_token_keeps_cache(self):
+        """Should only drop cached GETs when the access token actually changes"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers["authorization"])
+            return httpx.Response(200, json={})
+
+        http = make_http_client(handler, access_token="a", cache_ttl=60)
+
+        http.get("/auth/me")
+        http.set_access_token("a")
+        http.get("/auth/me")
+        http.set_access_token("b")
+        http.get("/auth/me")
+
+        assert calls == ["Bearer a", "Bearer b"]
+
+    def test_caching_disabled_by_default(self):
+        """Should not cache unless cache_ttl is set"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={})
+
+        http = make_http_client(handler)
+
+        http.get("/contacts")
+        http.get("/contacts")
+        assert len(calls) == 2
+
+
+class TestSharedConnectionPool:
+    """Tests for SharedConnectionPool"""
+
+    def test_clients_share_one_pool(self):
+        """Should reuse one transport per base URL until the last client closes"""
+        key = SharedConnectionPool._key("https://shared.test")
+        first = HttpClient(base_url="https://shared.test", share_pool=True)
+        second = HttpClient(base_url="https://shared.test/", share_pool=True)
+        transport = SharedConnectionPool._transports[key]
+
+        assert first._client._transport._transport is transport
+        assert second._client._transport._transport is transport
+
+        first.close()
+        first.close()
+        assert SharedConnectionPool._transports[key] is transport
+
+        second.close()
+        assert key not in SharedConnectionPool._transports
+
+    def test_different_settings_get_own_pool(self):
+        """Should not hand a client a pool built with other limits"""
+        default = HttpClient(base_url="https://shared.test", share_pool=True)
+        small = HttpClient(
+            base_url="https://shared.test", share_pool=True, limits=pool_limits(5, 2)
+        )
+        pool = small._client._transport._transport._pool
+
+        assert small._client._transport._transport is not default._client._transport._transport
+        assert pool._max_connections == 5
+        assert pool._max_keepalive_connections == 2
+
+        default.close()
+        small.close()
+        assert not SharedConnectionPool._transports
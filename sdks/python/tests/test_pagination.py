@@ -0,0 +1,69 @@
+"""Tests for pagination helpers"""
+
+from linktor.types.common import PaginatedResponse
+from linktor.utils.pagination import aiter_items, iter_items, iter_pages
+
+
+def make_page(items, offset, has_more, next_cursor=None):
+    return PaginatedResponse[int](
+        data=items,
+        pagination={
+            "total": 5,
+            "limit": 2,
+            "offset": offset,
+            "hasMore": has_more,
+            "nextCursor": next_cursor,
+        },
+    )
+
+
+class TestIterPages:
+    """Tests for iter_pages/iter_items"""
+
+    def test_follows_cursor(self):
+        """Should request the next page with the returned cursor"""
+        pages = {
+            None: make_page([1, 2], 0, True, "c2"),
+            "c2": make_page([3, 4], 2, True, "c3"),
+            "c3": make_page([5], 4, False),
+        }
+        calls = []
+
+        def fetch(**params):
+            calls.append(params)
+            return pages[params.get("cursor")]
+
+        assert list(iter_items(fetch, {"limit": 2})) == [1, 2, 3, 4, 5]
+        assert calls == [{"limit": 2}, {"limit": 2, "cursor": "c2"}, {"limit": 2, "cursor": "c3"}]
+
+    def test_falls_back_to_offset(self):
+        """Should advance the offset when no cursor is returned"""
+        pages = {0: make_page([1, 2], 0, True), 2: make_page([3], 2, False)}
+
+        def fetch(**params):
+            return pages[params.get("offset", 0)]
+
+        assert [page.data for page in iter_pages(fetch, {})] == [[1, 2], [3]]
+
+    def test_single_page(self):
+        """Should stop after a page without more results"""
+        calls = []
+
+        def fetch(**params):
+            calls.append(params)
+            return make_page([1], 0, False)
+
+        assert list(iter_items(fetch, {})) == [1]
+        assert len(calls) == 1
+
+    async def test_async_follows_cursor(self):
+        """Should iterate every page of an async list endpoint"""
+        pages = {
+            None: make_page([1, 2], 0, True, "c2"),
+            "c2": make_page([3], 2, False),
+        }
+
+        async def fetch(**params):
+            return pages[params.get("cursor")]
+
+        assert [item async for item in aiter_items(fetch, {})] == [1, 2, 3]
@@ -0,0 +1,100 @@
+"""Tests for SDK types"""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from linktor.types import (
+    Bot,
+    ChannelConfig,
+    Contact,
+    CreateAgentInput,
+    ListContactsParams,
+    SMSConfig,
+)
+from linktor.types.common import to_camel
+
+
+class TestCamelCaseAliases:
+    """Tests for the shared camelCase alias config"""
+
+    def test_to_camel(self):
+        """Should convert snake_case names to camelCase"""
+        assert to_camel("top_k") == "topK"
+        assert to_camel("knowledge_base_ids") == "knowledgeBaseIds"
+        assert to_camel("name") == "name"
+
+    def test_accepts_alias_and_field_name(self):
+        """Should populate fields from camelCase keys or their Python names"""
+        by_alias = CreateAgentInput(name="a", model="m", systemPrompt="p", maxTokens=5)
+        by_name = CreateAgentInput(name="a", model="m", system_prompt="p", max_tokens=5)
+
+        assert by_alias == by_name
+        assert by_name.model_dump(by_alias=True, exclude_none=True) == {
+            "name": "a",
+            "model": "m",
+            "systemPrompt": "p",
+            "maxTokens": 5,
+        }
+
+    def test_parses_api_response(self):
+        """Should read camelCase response keys"""
+        bot = Bot.model_validate(
+            {
+                "id": "b-1",
+                "tenantId": "t-1",
+                "name": "Bot",
+                "type": "ai",
+                "status": "active",
+                "config": {},
+                "channelIds": ["c-1"],
+                "createdAt": "2024-01-01T00:00:00Z",
+                "updatedAt": "2024-01-01T00:00:00Z",
+            }
+        )
+
+        assert bot.tenant_id == "t-1"
+        assert bot.channel_ids == ["c-1"]
+
+
+class TestDeferredBuild:
+    """Tests for request models whose schema is built on first use"""
+
+    def test_params_inherit_deferred_build(self):
+        """Should defer params models and keep their own alias config"""
+        assert ListContactsParams.model_config["defer_build"] is True
+        assert "defer_build" not in Contact.model_config
+
+        params = ListContactsParams(channelType="whatsapp", limit=10)
+
+        assert params.model_dump(by_alias=True, exclude_none=True) == {
+            "limit": 10,
+            "channelType": "whatsapp",
+        }
+
+
+class TestChannelConfig:
+    """Tests for the channel config union"""
+
+    def test_selects_variant_by_type(self):
+        """Should validate against the variant named by ``type``"""
+        adapter = TypeAdapter(ChannelConfig)
+
+        config = adapter.validate_python(
+            {"type": "sms", "accountSid": "AC1", "authToken": "t", "phoneNumber": "+1"}
+        )
+
+        assert isinstance(config, SMSConfig)
+        assert config.provider == "twilio"
+        with pytest.raises(ValidationError):
+            adapter.validate_python({"type": "fax"})
+
+    def test_untyped_config_still_validates(self):
+        """Should fall back to the plain union when ``type`` is omitted"""
+        adapter = TypeAdapter(ChannelConfig)
+
+        config = adapter.validate_python(
+            {"accountSid": "AC1", "authToken": "t", "phoneNumber": "+1"}
+        )
+
+        assert isinstance(config, SMSConfig)
+        assert config.type == "sms"
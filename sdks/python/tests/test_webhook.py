@@ -0,0 +1,110 @@
+"""Tests for webhook verification"""
+
+import hashlib
+import hmac
+import json
+import time
+
+import httpx
+import pytest
+
+from linktor.types.webhook import WebhookEventType
+from linktor.utils import webhook as webhook_module
+from linktor.utils.webhook import (
+    compute_signature,
+    construct_event,
+    verify_webhook,
+    verify_webhook_signature,
+)
+
+SECRET = "whsec_test"
+
+
+def sign(payload, secret=SECRET):
+    """Reference HMAC-SHA256 hex signature"""
+    return hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+
+
+def make_event(**overrides):
+    """Serialized webhook event body"""
+    event = {
+        "id": "evt-1",
+        "type": "message.received",
+        "timestamp": "2024-01-01T00:00:00Z",
+        "tenantId": "t-1",
+        "data": {"messageId": "m-1"},
+    }
+    event.update(overrides)
+    return json.dumps(event).encode("utf-8")
+
+
+class TestSignature:
+    """Tests for compute_signature/verify_webhook_signature"""
+
+    def test_matches_reference_hmac(self):
+        """Should produce the same signature for str and bytes across secrets"""
+        payload = make_event()
+
+        assert compute_signature(payload, SECRET) == sign(payload)
+        assert compute_signature(payload.decode("utf-8"), SECRET) == sign(payload)
+        assert compute_signature(payload, "other") == sign(payload, "other")
+        assert compute_signature(b"", SECRET) == sign(b"")
+
+    def test_keeps_only_latest_secret(self):
+        """Should hold keyed state for the most recent secret only"""
+        payload = make_event()
+
+        compute_signature(payload, "old-secret")
+        assert compute_signature(payload, SECRET) == sign(payload)
+        assert webhook_module._last_keyed[0] == SECRET
+
+    def test_verify_signature(self):
+        """Should accept the matching signature and reject anything else"""
+        payload = make_event()
+
+        assert verify_webhook_signature(payload, sign(payload), SECRET)
+        assert not verify_webhook_signature(payload, sign(payload, "other"), SECRET)
+        assert not verify_webhook_signature(payload, "", SECRET)
+        assert not verify_webhook_signature(payload, "z" * 64, SECRET)
+        assert not verify_webhook_signature(payload, sign(payload)[:-2], SECRET)
+        assert not verify_webhook_signature(payload, sign(payload), "")
+
+
+class TestVerifyWebhook:
+    """Tests for verify_webhook/construct_event"""
+
+    def test_checks_headers_and_timestamp(self):
+        """Should read headers case-insensitively and enforce the tolerance"""
+        payload = make_event()
+        now = str(int(time.time()))
+
+        assert verify_webhook(
+            payload, {"X-Linktor-Signature": sign(payload), "X-Linktor-Timestamp": now}, SECRET
+        )
+        assert not verify_webhook(
+            payload, {"x-linktor-signature": sign(payload), "x-linktor-timestamp": "1"}, SECRET
+        )
+        assert not verify_webhook(payload, {"Content-Type": "application/json"}, SECRET)
+
+    def test_accepts_header_mappings(self):
+        """Should read signatures from case-insensitive header objects"""
+        payload = make_event()
+        headers = httpx.Headers({"X-Linktor-Signature": sign(payload)})
+
+        assert verify_webhook(payload, headers, SECRET)
+
+    def test_construct_event(self):
+        """Should parse a verified body into a typed event"""
+        payload = make_event()
+
+        event = construct_event(payload, {"x-linktor-signature": sign(payload)}, SECRET)
+
+        assert event.type is WebhookEventType.MESSAGE_RECEIVED
+        assert event.tenant_id == "t-1"
+        assert event.data == {"messageId": "m-1"}
+
+    def test_construct_event_rejects_invalid_body(self):
+        """Should raise ValueError for bad JSON or missing event fields"""
+        for payload in (b"{not json", make_event(id="")):
+            with pytest.raises(ValueError):
+                construct_event(payload, {"x-linktor-signature": sign(payload)}, SECRET)